@@ -3,21 +3,40 @@
 This module provides the BigQueryManager class for managing BigQuery external
 tables that reference CSV files in GCS. Includes table creation with Hive
 partitioning, listing tables, and schema auto-detection.
+
+The google.cloud.bigquery and google.cloud.storage packages are imported
+lazily where they are used; importing them eagerly adds ~0.5s to CLI startup.
 """
 
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+import functools
+import json
 import re
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional, Set, Tuple, TypeVar, cast
 
+import requests
 from google.api_core import exceptions as google_api_exceptions
-from google.cloud import bigquery, storage
 
 from datawagon.bucket.analytics_provider import AnalyticsProvider
+from datawagon.bucket.client_utils import mount_pooled_adapter
 from datawagon.bucket.retry_utils import retry_with_backoff
 from datawagon.logging_config import get_logger
-from datawagon.objects.bigquery_table_metadata import BigQueryTableInfo
+from datawagon.objects.bigquery_table_metadata import BigQueryTableInfo, ExternalTableSpec
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery, storage  # type: ignore[attr-defined]
 
 logger = get_logger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 # BigQuery transient failures that should be retried
 TRANSIENT_EXCEPTIONS = (
     google_api_exceptions.ServiceUnavailable,  # 503
@@ -26,6 +45,131 @@ TRANSIENT_EXCEPTIONS = (
     google_api_exceptions.TooManyRequests,  # 429 rate limiting
 )
 
+# BigQuery table names this tool creates: ASCII letters, digits, underscores (max 1024)
+_BQ_TABLE_NAME_RE = re.compile(r"[A-Za-z0-9_]{1,1024}")
+
+# Clients shared per project so every manager reuses one pooled HTTP session
+_bq_client_cache: Dict[str, bigquery.Client] = {}
+_storage_client_cache: Dict[str, storage.Client] = {}
+_client_cache_lock = threading.Lock()
+
+# (bucket_name, storage_folder_name) -> (schema, has_title_row) from successful inference
+_schema_cache: Dict[Tuple[str, str], Tuple[List[bigquery.SchemaField], bool]] = {}
+
+# Worker pool shared by every manager for create_external_table_async
+_create_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_bq_client(project_id: str) -> bigquery.Client:
+    """Return the shared BigQuery client for a project, creating it on first use."""
+    with _client_cache_lock:
+        client = _bq_client_cache.get(project_id)
+        if client is None:
+            from google.cloud import bigquery
+
+            client = bigquery.Client(project=project_id)
+            mount_pooled_adapter(client)
+            _bq_client_cache[project_id] = client
+        return client
+
+
+def _get_storage_client(project_id: str) -> storage.Client:
+    """Return the shared GCS client for a project, creating it on first use."""
+    with _client_cache_lock:
+        client = _storage_client_cache.get(project_id)
+        if client is None:
+            from google.cloud import storage  # type: ignore[attr-defined]
+
+            client = storage.Client(project=project_id)
+            mount_pooled_adapter(client)
+            _storage_client_cache[project_id] = client
+        return client
+
+
+def _handle_bq_errors(action: str, default: Any) -> Callable[[F], F]:
+    """Map exceptions from a manager method to a logged default result.
+
+    Expected API outcomes (auth, permissions, missing objects, rejected requests)
+    log one line without a traceback; only unexpected errors pay for exc_info.
+    Apply outside retry_with_backoff so transient errors are retried first.
+
+    Args:
+        action: Gerund phrase for log messages (e.g., "deleting table")
+        default: Value returned (shallow-copied) when an exception is handled
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except google_api_exceptions.Unauthenticated as e:
+                logger.error(f"Authentication failed {action}: {e}")
+                logger.error("Authentication required. Run: gcloud auth application-default login")
+            except google_api_exceptions.PermissionDenied as e:
+                logger.error(f"Permission denied {action}: {e}")
+            except google_api_exceptions.NotFound as e:
+                logger.error(f"Not found while {action}: {e}")
+            except google_api_exceptions.GoogleAPIError as e:
+                logger.error(f"Error {action}: {e}")
+            except Exception as e:
+                logger.error(f"Error {action}: {e}", exc_info=True)
+            return copy.copy(default)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def _sql_string(value: str) -> str:
+    """Quote a value as a GoogleSQL string literal."""
+    return json.dumps(value)
+
+
+def _set_metadata_cache_mode(external_config: "bigquery.ExternalConfig", mode: str) -> None:
+    """Set metadataCacheMode on an external table config.
+
+    google-cloud-bigquery exposes no ExternalConfig property for this REST field,
+    so it is written to the raw resource here and nowhere else. Replace with the
+    public property once the client library adds one.
+    """
+    external_config._properties["metadataCacheMode"] = mode
+
+
+def _is_valid_table_name(table_name: str) -> bool:
+    """Check a table name locally so bad input never costs a BigQuery round trip."""
+    return _BQ_TABLE_NAME_RE.fullmatch(table_name) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _partition_columns_for_uri(source_uri: str) -> Tuple[str, ...]:
+    """Scan a source URI for Hive partition segments like "column_name=*"."""
+    # Plain scan over path segments (no regex)
+    partition_columns = []
+    for segment in source_uri.split("/"):
+        if segment.endswith("=*"):
+            column = segment[:-2]
+            if column.replace("_", "").isalnum():
+                partition_columns.append(column)
+    return tuple(partition_columns)
+
+
+def _get_create_executor() -> ThreadPoolExecutor:
+    """Return the shared table-creation pool, creating it on first use."""
+    global _create_executor
+    with _client_cache_lock:
+        if _create_executor is None:
+            _create_executor = ThreadPoolExecutor(
+                max_workers=BigQueryManager.DEFAULT_MAX_WORKERS, thread_name_prefix="bq-create"
+            )
+        return _create_executor
+
+
+def clear_client_cache() -> None:
+    """Drop shared clients (e.g., after credentials change or between tests)."""
+    _bq_client_cache.clear()
+    _storage_client_cache.clear()
+
 
 class BigQueryManager(AnalyticsProvider):
     """Google BigQuery implementation of AnalyticsProvider.
@@ -36,39 +180,85 @@ class BigQueryManager(AnalyticsProvider):
 
     Attributes:
         bq_client: BigQuery client
+        storage_client: GCS client for schema inference (created lazily on first access)
         project_id: GCP project ID
         _dataset_id: BigQuery dataset name (private, accessed via property)
         bucket_name: GCS bucket name for source URIs
+        max_workers: Maximum concurrent metadata requests when listing tables
+        connection_id: Optional BigLake connection used for metadata-cached tables
         _has_error: Flag indicating if initialization encountered errors (private)
     """
 
-    def __init__(self, project_id: str, dataset_id: str, bucket_name: str) -> None:
+    # Default number of concurrent get_table requests in list_external_tables
+    DEFAULT_MAX_WORKERS = 16
+
+    # How long a table_exists result is trusted before asking BigQuery again
+    TABLE_EXISTS_TTL_SECONDS = 60.0
+
+    # Default metadata cache staleness (SQL INTERVAL "Y-M D H:M:S" encoding: 1 hour)
+    DEFAULT_MAX_STALENESS = "0-0 0 1:0:0"
+
+    # Maximum GoogleSQL query text length accepted by jobs.insert (1024K characters)
+    MAX_QUERY_LENGTH = 1024 * 1024
+
+    # tables.list page size (API default is 50; larger pages mean fewer round trips)
+    LIST_TABLES_PAGE_SIZE = 1000
+
+    # Upper bound on the dataset access check so an unreachable API can't stall startup
+    DATASET_PROBE_TIMEOUT_SECONDS = 5.0
+
+    def __init__(
+        self,
+        project_id: str,
+        dataset_id: str,
+        bucket_name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        connection_id: Optional[str] = None,
+        dataset_probe_timeout: float = DATASET_PROBE_TIMEOUT_SECONDS,
+    ) -> None:
         """Initialize BigQuery manager and verify dataset access.
 
-        Creates BigQuery client, verifies dataset exists and is accessible,
-        and sets error flag if connection fails.
+        Reuses the project's shared BigQuery client (pooled HTTP connections),
+        verifies dataset exists and is accessible, and sets error flag if
+        connection fails. The GCS client is only created if schema inference runs.
 
         Args:
             project_id: GCP project ID
             dataset_id: BigQuery dataset name
             bucket_name: GCS bucket name (for constructing source URIs)
+            max_workers: Maximum concurrent metadata requests when listing tables (default: 16)
+            connection_id: BigLake connection (e.g., "us.my-connection"). When set, created
+                tables use metadata caching so queries skip listing GCS objects.
+            dataset_probe_timeout: Seconds to wait for the dataset access check (default: 5.0)
 
         Note:
-            Sets has_error=True if authentication or permissions fail.
+            Sets has_error=True if authentication or permissions fail, or if the
+            dataset check does not answer within dataset_probe_timeout.
             Run 'gcloud auth application-default login' if authentication fails.
         """
-        self.bq_client = bigquery.Client(project=project_id)
-        self.storage_client = storage.Client(project=project_id)
+        self.bq_client = _get_bq_client(project_id)
         self.project_id = project_id
         self._dataset_id = dataset_id
         self.bucket_name = bucket_name
+        self.max_workers = max_workers
+        self.connection_id = connection_id
         self._has_error = False
+        # Fully-qualified references reused by every table operation
+        self._dataset_ref = f"{project_id}.{dataset_id}"
+        self._table_ref_prefix = self._dataset_ref + "."
+        # table_name -> (exists, checked_at) for table_exists short-circuiting
+        self._exists_cache: Dict[str, Tuple[bool, float]] = {}
 
         try:
             # Verify dataset exists and is accessible
-            dataset_ref = f"{project_id}.{dataset_id}"
-            dataset = self.bq_client.get_dataset(dataset_ref)
+            dataset = self._probe_dataset(self._dataset_ref, dataset_probe_timeout)
             logger.info(f"Found BigQuery dataset: {dataset.dataset_id}")
+        except TimeoutError:
+            logger.error(
+                f"Timed out after {dataset_probe_timeout}s verifying BigQuery dataset: {dataset_id}. "
+                "Check network access to bigquery.googleapis.com"
+            )
+            self._has_error = True
         except google_api_exceptions.Unauthenticated as e:
             logger.error(f"BigQuery authentication failed: {e}")
             logger.error("Authentication required. Run: gcloud auth application-default login")
@@ -84,7 +274,54 @@ class BigQueryManager(AnalyticsProvider):
             logger.error(f"Error connecting to BigQuery: {e}", exc_info=True)
             self._has_error = True
 
+    def _probe_dataset(self, dataset_ref: str, timeout: float) -> bigquery.Dataset:
+        """Fetch dataset metadata, giving up after timeout seconds.
+
+        The client's default retry policy can keep retrying for minutes, so both the
+        per-request timeout and the overall retry deadline are bounded.
+
+        Raises:
+            TimeoutError: If get_dataset has not succeeded in time
+        """
+        from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+        try:
+            return self.bq_client.get_dataset(dataset_ref, retry=DEFAULT_RETRY.with_deadline(timeout), timeout=timeout)
+        except (google_api_exceptions.RetryError, requests.exceptions.Timeout) as e:
+            raise TimeoutError(f"get_dataset({dataset_ref}) did not succeed within {timeout}s") from e
+
+    @classmethod
+    def bulk_init(
+        cls,
+        configs: List[Tuple[str, str, str]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[BigQueryManager]:
+        """Construct several managers concurrently.
+
+        Each constructor blocks on a dataset access check; fanning them out over one
+        executor makes the total startup cost roughly that of the slowest check.
+
+        Args:
+            configs: (project_id, dataset_id, bucket_name) tuples
+            max_workers: Maximum concurrent constructors (default: 16)
+
+        Returns:
+            Managers in the same order as configs; check has_error on each
+
+        Example:
+            >>> managers = BigQueryManager.bulk_init([
+            ...     ("proj", "youtube_analytics", "bucket-a"),
+            ...     ("proj", "staging", "bucket-b"),
+            ... ])
+        """
+        if not configs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(configs))) as executor:
+            return list(executor.map(lambda config: cls(*config), configs))
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def normalize_table_name(table_name: str, file_version: str) -> str:
         """Convert table name and version to BigQuery-compatible format.
 
@@ -110,10 +347,16 @@ class BigQueryManager(AnalyticsProvider):
             return f"{table_name}_{bq_version}"
         return table_name
 
+    @_handle_bq_errors("listing tables", default=[])
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
-    def list_external_tables(self) -> List[BigQueryTableInfo]:
+    def list_external_tables(self, use_information_schema: bool = False) -> List[BigQueryTableInfo]:
         """List all external tables in the dataset.
 
+        Args:
+            use_information_schema: Read metadata for every table with a single
+                INFORMATION_SCHEMA query instead of one get_table call per table.
+                Intended for bulk listing only; the query is billed per dataset scan.
+
         Returns:
             List of BigQueryTableInfo for external tables only
 
@@ -124,68 +367,183 @@ class BigQueryManager(AnalyticsProvider):
         if self._has_error:
             return []
 
+        if use_information_schema:
+            external_tables = self._list_external_tables_from_information_schema()
+        else:
+            external_tables = self._list_external_tables_from_api()
+
+        logger.info(f"Found {len(external_tables)} external tables in {self._dataset_id}")
+        return external_tables
+
+    def iter_external_tables(self) -> Generator[BigQueryTableInfo, None, None]:
+        """Yield external tables as their metadata arrives.
+
+        Metadata is fetched concurrently and each table is yielded as soon as its
+        get_table call completes, so callers that stop early (e.g., ``next(...)``)
+        don't wait for the whole dataset. Pending fetches are cancelled when the
+        generator is closed.
+
+        Yields:
+            BigQueryTableInfo for each external table, in completion order
+
+        Raises:
+            google.api_core.exceptions.GoogleAPIError: Unlike list_external_tables,
+                errors propagate to the caller without retry
+
+        Example:
+            >>> first = next(manager.iter_external_tables(), None)
+        """
+        if self._has_error:
+            return
+
+        table_refs = [
+            table_item.reference
+            for table_item in self.bq_client.list_tables(self._dataset_ref, page_size=self.LIST_TABLES_PAGE_SIZE)
+            if table_item.table_type == "EXTERNAL"
+        ]
+        if not table_refs:
+            return
+
+        # Fetch full table metadata concurrently (one get_table round trip per table)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
         try:
-            dataset_ref = f"{self.project_id}.{self._dataset_id}"
-            tables = self.bq_client.list_tables(dataset_ref)
-
-            external_tables = []
-            for table_item in tables:
-                # Get full table metadata
-                table = self.bq_client.get_table(table_item.reference)
-
-                # Only include external tables
-                if table.external_data_configuration:
-                    ext_config = table.external_data_configuration
-
-                    # Extract partition info
-                    is_partitioned = False
-                    partition_columns = None
-                    if ext_config.hive_partitioning:
-                        is_partitioned = True
-                        # Extract partition columns from source URI pattern
-                        if ext_config.source_uris:
-                            partition_columns = self._extract_partition_columns(ext_config.source_uris[0])
-
-                    # Construct source URI pattern
-                    source_uri_pattern = ext_config.source_uris[0] if ext_config.source_uris else ""
-
-                    table_info = BigQueryTableInfo(
-                        table_name=table.table_id,
-                        dataset_id=self._dataset_id,
-                        project_id=self.project_id,
-                        source_uri_pattern=source_uri_pattern,
-                        is_partitioned=is_partitioned,
-                        partition_columns=partition_columns,
-                        created_time=table.created,
-                        num_rows=table.num_rows,
-                    )
-                    external_tables.append(table_info)
-
-            logger.info(f"Found {len(external_tables)} external tables in {self._dataset_id}")
-            return external_tables
-
-        except google_api_exceptions.NotFound as e:
-            logger.error(f"Dataset not found: {e}")
-            return []
-        except google_api_exceptions.PermissionDenied as e:
-            logger.error(f"Permission denied listing tables: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Error listing tables: {e}", exc_info=True)
-            return []
+            futures = [executor.submit(self._fetch_table, table_ref) for table_ref in table_refs]
+            for future in concurrent.futures.as_completed(futures):
+                table_info = self._table_info_from_table(future.result())
+                if table_info is not None:
+                    yield table_info
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _list_external_tables_from_api(self) -> List[BigQueryTableInfo]:
+        """List external tables using list_tables plus concurrent get_table calls.
+
+        The listing already reports each table's type, so native tables and views are
+        dropped before any get_table round trip.
+
+        Returns:
+            List of BigQueryTableInfo for external tables only, sorted by table name
+        """
+        return sorted(self.iter_external_tables(), key=lambda table_info: table_info.table_name)
+
+    def _table_info_from_table(self, table: Optional[bigquery.Table]) -> Optional[BigQueryTableInfo]:
+        """Build BigQueryTableInfo from full table metadata.
+
+        Args:
+            table: Table from get_table, or None if it was deleted after listing
+
+        Returns:
+            BigQueryTableInfo, or None if the table is missing or not external
+        """
+        if table is None or not table.external_data_configuration:
+            return None
+
+        ext_config = table.external_data_configuration
+
+        # Extract partition info
+        is_partitioned = False
+        partition_columns = None
+        if ext_config.hive_partitioning:
+            is_partitioned = True
+            # Extract partition columns from source URI pattern
+            if ext_config.source_uris:
+                partition_columns = self._extract_partition_columns(ext_config.source_uris[0])
+
+        # Construct source URI pattern
+        source_uri_pattern = ext_config.source_uris[0] if ext_config.source_uris else ""
+
+        return BigQueryTableInfo(
+            table_name=table.table_id,
+            dataset_id=self._dataset_id,
+            project_id=self.project_id,
+            source_uri_pattern=source_uri_pattern,
+            is_partitioned=is_partitioned,
+            partition_columns=partition_columns,
+            created_time=table.created,
+            num_rows=table.num_rows,
+        )
+
+    def _list_external_tables_from_information_schema(self) -> List[BigQueryTableInfo]:
+        """List external tables with one INFORMATION_SCHEMA query.
+
+        Joins INFORMATION_SCHEMA.TABLES with TABLE_OPTIONS so source URIs and
+        Hive partitioning settings for every external table arrive in one round trip.
+
+        Returns:
+            List of BigQueryTableInfo for external tables only, sorted by table name
+        """
+        query = (
+            "SELECT t.table_name, t.creation_time, o.option_name, o.option_value "
+            f"FROM `{self._dataset_ref}`.INFORMATION_SCHEMA.TABLES AS t "
+            f"LEFT JOIN `{self._dataset_ref}`.INFORMATION_SCHEMA.TABLE_OPTIONS AS o USING (table_name) "
+            "WHERE t.table_type = 'EXTERNAL' "
+            "ORDER BY t.table_name"
+        )
+
+        # One row per (table, option) - regroup options by table
+        created_times: Dict[str, Optional[datetime]] = {}
+        table_options: Dict[str, Dict[str, str]] = {}
+        for row in self.bq_client.query(query).result():
+            created_times[row.table_name] = row.creation_time
+            options = table_options.setdefault(row.table_name, {})
+            if row.option_name:
+                options[row.option_name] = row.option_value
+
+        external_tables = []
+        for table_name, options in table_options.items():
+            # Option values are SQL literals, e.g. uris = '["gs://bucket/folder/*"]'
+            source_uris = json.loads(options["uris"]) if "uris" in options else []
+            source_uri_pattern = source_uris[0] if source_uris else ""
+
+            is_partitioned = "hive_partition_uri_prefix" in options
+            partition_columns = None
+            if is_partitioned and source_uri_pattern:
+                partition_columns = self._extract_partition_columns(source_uri_pattern)
+
+            table_info = BigQueryTableInfo(
+                table_name=table_name,
+                dataset_id=self._dataset_id,
+                project_id=self.project_id,
+                source_uri_pattern=source_uri_pattern,
+                is_partitioned=is_partitioned,
+                partition_columns=partition_columns,
+                created_time=created_times[table_name],
+            )
+            external_tables.append(table_info)
+
+        return external_tables
+
+    def _fetch_table(self, table_ref: bigquery.TableReference) -> Optional[bigquery.Table]:
+        """Fetch full table metadata, tolerating tables deleted after listing.
+
+        Args:
+            table_ref: Reference to the table returned by list_tables
+
+        Returns:
+            Table with full metadata, or None if the table no longer exists
+
+        Note:
+            Transient errors propagate so the outer retry can re-run the listing.
+        """
+        try:
+            return self.bq_client.get_table(table_ref)
+        except google_api_exceptions.NotFound:
+            logger.debug(f"Table disappeared during listing: {table_ref}")
+            return None
 
     @staticmethod
     def _extract_partition_columns(source_uri: str) -> List[str]:
         """Extract partition column names from GCS URI pattern.
 
+        Tables under one folder hierarchy share URI templates, so the scan is
+        cached per URI; each call returns a fresh list.
+
         Example:
             gs://bucket/folder/report_date=*/file.csv.gz → ["report_date"]
         """
-        # Find all patterns like "column_name=*"
-        pattern = r"/(\w+)=\*"
-        matches = re.findall(pattern, source_uri)
-        return matches
+        return list(_partition_columns_for_uri(source_uri))
 
+    @_handle_bq_errors("creating table", default=False)
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
     def create_external_table(
         self,
@@ -194,6 +552,9 @@ class BigQueryManager(AnalyticsProvider):
         use_hive_partitioning: bool = True,
         schema: Optional[List[bigquery.SchemaField]] = None,
         use_autodetect_fallback: bool = True,
+        max_staleness: str = DEFAULT_MAX_STALENESS,
+        metadata_cache_mode: str = "AUTOMATIC",
+        header_rows: int = 1,
     ) -> bool:
         """Create external table referencing GCS CSV files.
 
@@ -201,6 +562,7 @@ class BigQueryManager(AnalyticsProvider):
         - CSV format with GZIP compression
         - Explicit schema with lowercase column names (or auto-detected schema)
         - Hive partitioning on report_date column (if enabled)
+        - Metadata caching (if the manager has a BigLake connection_id)
 
         Args:
             table_name: BigQuery table name (e.g., "claim_raw_v1_1")
@@ -208,6 +570,11 @@ class BigQueryManager(AnalyticsProvider):
             use_hive_partitioning: Enable Hive partitioning (default: True)
             schema: Optional explicit schema. If None, will attempt to infer from CSV.
             use_autodetect_fallback: If schema inference fails, fall back to autodetect
+            max_staleness: Metadata cache staleness as a SQL interval (default: 1 hour)
+            metadata_cache_mode: "AUTOMATIC" or "MANUAL" cache refresh (default: "AUTOMATIC")
+            header_rows: Header rows per file, not counting a detected title row (default: 1).
+                Pass 0 when the producer guarantees headerless files so queries don't
+                read and discard a row from every file.
 
         Returns:
             True if creation succeeded, False otherwise
@@ -222,108 +589,357 @@ class BigQueryManager(AnalyticsProvider):
         if self._has_error:
             return False
 
-        try:
-            # Construct table reference
-            table_ref = f"{self.project_id}.{self._dataset_id}.{table_name}"
-
-            # Build source URIs
-            if use_hive_partitioning:
-                source_uri_prefix = f"gs://{self.bucket_name}/{storage_folder_name}"
-                # BigQuery limitation: Only single wildcard supported
-                # Files must be filtered at upload time, not query time
-                source_uris = [f"{source_uri_prefix}/*"]
-            else:
-                source_uris = [f"gs://{self.bucket_name}/{storage_folder_name}/*.csv.gz"]
-
-            # Create external configuration for CSV
-            external_config = bigquery.ExternalConfig("CSV")
-            external_config.source_uris = source_uris
-            external_config.compression = "GZIP"
+        if not _is_valid_table_name(table_name):
+            logger.error(f"Invalid BigQuery table name: {table_name!r}")
+            return False
 
-            # Use explicit schema if provided, otherwise try to infer
-            has_title_row = False
-            if schema is None:
-                from datawagon.bucket.schema_inference import SchemaInferenceManager
+        from google.cloud import bigquery
+
+        # Construct table reference
+        table_ref = self._table_ref_prefix + table_name
+
+        # Build source URIs
+        source_uri_prefix, source_uris = self._source_uris(storage_folder_name, use_hive_partitioning)
+
+        # Create external configuration for CSV
+        external_config = bigquery.ExternalConfig("CSV")
+        external_config.source_uris = source_uris
+        external_config.compression = "GZIP"
+
+        # Use explicit schema if provided, otherwise try to infer
+        schema, has_title_row = self._resolve_schema(storage_folder_name, schema)
+
+        # Set schema or fall back to autodetect
+        if schema:
+            external_config.schema = schema
+            external_config.autodetect = False
+            logger.info(f"Using explicit schema with {len(schema)} columns")
+        elif use_autodetect_fallback:
+            external_config.autodetect = True
+            logger.warning(
+                f"Schema inference failed for {storage_folder_name}, "
+                "falling back to autodetect (column names may not be lowercase)"
+            )
+        else:
+            logger.error("Schema inference failed and autodetect disabled")
+            return False
 
-                schema_manager = SchemaInferenceManager(self.storage_client, self.bucket_name)
-                inference_result = schema_manager.infer_schema(storage_folder_name)
-
-                if inference_result is not None:
-                    schema, has_title_row = inference_result
-                else:
-                    schema = None
-            else:
-                # When schema is provided explicitly, assume no title row
-                # (in the future, this could be made configurable via a parameter)
-                has_title_row = False
-
-            # Set schema or fall back to autodetect
-            if schema:
-                external_config.schema = schema
-                external_config.autodetect = False
-                logger.info(f"Using explicit schema with {len(schema)} columns")
-            elif use_autodetect_fallback:
-                external_config.autodetect = True
-                logger.warning(
-                    f"Schema inference failed for {storage_folder_name}, "
-                    "falling back to autodetect (column names may not be lowercase)"
-                )
-            else:
-                logger.error("Schema inference failed and autodetect disabled")
-                return False
-
-            # Configure CSV-specific options
-            csv_options = bigquery.CSVOptions()
-            # Skip title row (if present) + header row
-            skip_rows = 2 if has_title_row else 1
-            csv_options.skip_leading_rows = skip_rows
-            logger.info(f"CSV skip_leading_rows set to {skip_rows} (has_title_row={has_title_row})")
-            external_config.csv_options = csv_options
-
-            # Configure Hive partitioning if enabled
-            if use_hive_partitioning:
-                hive_partitioning = bigquery.HivePartitioningOptions()
-                hive_partitioning.mode = "AUTO"
-                hive_partitioning.source_uri_prefix = source_uri_prefix
-                external_config.hive_partitioning = hive_partitioning
-
-            # Create table
-            table = bigquery.Table(table_ref)
-            table.external_data_configuration = external_config
+        # Configure CSV-specific options
+        csv_options = bigquery.CSVOptions()
+        # Skip title row (if present) + header rows
+        skip_rows = header_rows + (1 if has_title_row else 0)
+        csv_options.skip_leading_rows = skip_rows
+        logger.info(f"CSV skip_leading_rows set to {skip_rows} (has_title_row={has_title_row})")
+        external_config.csv_options = csv_options
+
+        # Configure Hive partitioning if enabled
+        if use_hive_partitioning:
+            hive_partitioning = bigquery.HivePartitioningOptions()
+            hive_partitioning.mode = "AUTO"
+            hive_partitioning.source_uri_prefix = source_uri_prefix
+            external_config.hive_partitioning = hive_partitioning
+
+        # Enable metadata caching (BigLake tables only) so queries skip GCS listing
+        if self.connection_id:
+            external_config.connection_id = self.connection_id
+            _set_metadata_cache_mode(external_config, metadata_cache_mode)
+            logger.info(f"Metadata caching enabled (mode={metadata_cache_mode}, max_staleness={max_staleness})")
+        else:
+            logger.info("Metadata caching disabled (no BigLake connection configured)")
+
+        # Create table
+        table = bigquery.Table(table_ref)
+        table.external_data_configuration = external_config
+        if self.connection_id:
+            table.max_staleness = max_staleness
 
+        try:
             created_table = self.bq_client.create_table(table)
-            logger.info(f"Created external table: {created_table.full_table_id}")
-            return True
-
         except google_api_exceptions.Conflict:
+            self._remember_exists(table_name, True)
             logger.error(f"Table already exists: {table_name}")
             return False
-        except google_api_exceptions.PermissionDenied as e:
-            logger.error(f"Permission denied creating table: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Error creating table: {e}", exc_info=True)
-            return False
 
+        self._remember_exists(table_name, True)
+        logger.info(f"Created external table: {created_table.full_table_id}")
+        return True
+
+    def _source_uris(self, storage_folder_name: str, use_hive_partitioning: bool) -> Tuple[str, List[str]]:
+        """Build the GCS source URI prefix and URI list for an external table.
+
+        Args:
+            storage_folder_name: GCS folder path
+            use_hive_partitioning: Whether the table uses Hive partitioning
+
+        Returns:
+            Tuple of (source_uri_prefix, source_uris)
+        """
+        source_uri_prefix = f"gs://{self.bucket_name}/{storage_folder_name}"
+        if use_hive_partitioning:
+            # BigQuery limitation: Only single wildcard supported
+            # Files must be filtered at upload time, not query time
+            return source_uri_prefix, [f"{source_uri_prefix}/*"]
+        return source_uri_prefix, [f"{source_uri_prefix}/*.csv.gz"]
+
+    def _resolve_schema(
+        self, storage_folder_name: str, schema: Optional[List[bigquery.SchemaField]]
+    ) -> Tuple[Optional[List[bigquery.SchemaField]], bool]:
+        """Return the explicit schema, or infer one from the folder's CSV files.
+
+        Args:
+            storage_folder_name: GCS folder path
+            schema: Explicit schema, or None to infer
+
+        Returns:
+            Tuple of (schema or None if inference failed, has_title_row)
+        """
+        if schema is not None:
+            # When schema is provided explicitly, assume no title row
+            # (in the future, this could be made configurable via a parameter)
+            return schema, False
+
+        # Tables over the same folder share a header: download it once
+        cache_key = (self.bucket_name, storage_folder_name)
+        cached = _schema_cache.get(cache_key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
+
+        from datawagon.bucket.schema_inference import SchemaInferenceManager
+
+        schema_manager = SchemaInferenceManager(self.storage_client, self.bucket_name)
+        inference_result = schema_manager.infer_schema(storage_folder_name)
+
+        if inference_result is not None:
+            inferred_schema, has_title_row = inference_result
+            # Only successes are cached so a transient failure is retried next time
+            _schema_cache[cache_key] = (list(inferred_schema), has_title_row)
+            return inferred_schema, has_title_row
+        return None, False
+
+    def create_external_table_async(
+        self,
+        table_name: str,
+        storage_folder_name: str,
+        use_hive_partitioning: bool = True,
+        schema: Optional[List[bigquery.SchemaField]] = None,
+        use_autodetect_fallback: bool = True,
+        max_staleness: str = DEFAULT_MAX_STALENESS,
+        metadata_cache_mode: str = "AUTOMATIC",
+        header_rows: int = 1,
+    ) -> Future[bool]:
+        """Start create_external_table on a shared worker pool.
+
+        Lets callers overlap many create_table round trips and collect results
+        with concurrent.futures.as_completed. Arguments match create_external_table.
+        For large batches, create_external_tables (one DDL job) may scale better.
+
+        Returns:
+            Future resolving to create_external_table's result
+
+        Example:
+            >>> futures = [manager.create_external_table_async(t, f) for t, f in pending]
+            >>> all(future.result() for future in as_completed(futures))
+            True
+        """
+        return _get_create_executor().submit(
+            self.create_external_table,
+            table_name=table_name,
+            storage_folder_name=storage_folder_name,
+            use_hive_partitioning=use_hive_partitioning,
+            schema=schema,
+            use_autodetect_fallback=use_autodetect_fallback,
+            max_staleness=max_staleness,
+            metadata_cache_mode=metadata_cache_mode,
+            header_rows=header_rows,
+        )
+
+    def create_external_tables(
+        self,
+        specs: List[ExternalTableSpec],
+        max_staleness: str = DEFAULT_MAX_STALENESS,
+        metadata_cache_mode: str = "AUTOMATIC",
+        use_autodetect_fallback: bool = True,
+    ) -> List[bool]:
+        """Create many external tables with a single multi-statement DDL job.
+
+        Each table gets its own CREATE EXTERNAL TABLE statement wrapped in an
+        exception block, so one failure does not abort the rest of the batch.
+        A single spec, or a script over BigQuery's query length limit, goes
+        through create_external_table instead.
+
+        Args:
+            specs: Tables to create
+            max_staleness: Metadata cache staleness as a SQL interval (BigLake only)
+            metadata_cache_mode: Metadata cache refresh mode (BigLake only)
+            use_autodetect_fallback: If schema inference fails, fall back to autodetect;
+                otherwise that table is not created
+
+        Returns:
+            One success flag per spec, in the same order
+
+        Example:
+            >>> manager.create_external_tables([
+            ...     ExternalTableSpec(table_name="claim_raw_v1_0", storage_folder_name="caravan/claim_raw_v1-0"),
+            ...     ExternalTableSpec(table_name="claim_raw_v1_1", storage_folder_name="caravan/claim_raw_v1-1"),
+            ... ])
+            [True, True]
+        """
+        if self._has_error:
+            return [False] * len(specs)
+
+        if len(specs) == 1:
+            spec = specs[0]
+            return [
+                self.create_external_table(
+                    table_name=spec.table_name,
+                    storage_folder_name=spec.storage_folder_name,
+                    use_hive_partitioning=spec.use_hive_partitioning,
+                    schema=spec.schema_fields,
+                    use_autodetect_fallback=use_autodetect_fallback,
+                    max_staleness=max_staleness,
+                    metadata_cache_mode=metadata_cache_mode,
+                    header_rows=spec.header_rows,
+                )
+            ]
+
+        statements = []
+        failed_tables = set()
+        for spec in specs:
+            if not _is_valid_table_name(spec.table_name):
+                logger.error(f"Invalid BigQuery table name: {spec.table_name!r}")
+                failed_tables.add(spec.table_name)
+                continue
+            schema, has_title_row = self._resolve_schema(spec.storage_folder_name, spec.schema_fields)
+            if not schema:
+                if not use_autodetect_fallback:
+                    logger.error(f"Schema inference failed for {spec.storage_folder_name} and autodetect disabled")
+                    failed_tables.add(spec.table_name)
+                    continue
+                logger.warning(f"Schema inference failed for {spec.storage_folder_name}, using autodetect")
+            ddl = self._external_table_ddl(spec, schema, has_title_row, max_staleness, metadata_cache_mode)
+            statements.append(
+                f"BEGIN\n  {ddl};\n"
+                "EXCEPTION WHEN ERROR THEN\n"
+                f"  SET failures = ARRAY_CONCAT(failures, [STRUCT({_sql_string(spec.table_name)} AS table_name, "
+                "@@error.message AS message)]);\n"
+                "END;"
+            )
+        if not statements:
+            return [False] * len(specs)
+
+        script = self._batch_script(statements)
+
+        if len(script) > self.MAX_QUERY_LENGTH:
+            # Inferred schemas are cached, so the per-table calls don't re-read the CSV headers
+            logger.debug(f"Create script is {len(script)} characters, creating {len(statements)} tables one at a time")
+            return [
+                spec.table_name not in failed_tables
+                and self.create_external_table(
+                    table_name=spec.table_name,
+                    storage_folder_name=spec.storage_folder_name,
+                    use_hive_partitioning=spec.use_hive_partitioning,
+                    schema=spec.schema_fields,
+                    use_autodetect_fallback=use_autodetect_fallback,
+                    max_staleness=max_staleness,
+                    metadata_cache_mode=metadata_cache_mode,
+                    header_rows=spec.header_rows,
+                )
+                for spec in specs
+            ]
+
+        script_failures = self._create_tables_in_one_job(script)
+        if script_failures is None:
+            return [False] * len(specs)
+        failed_tables |= script_failures
+
+        results = []
+        for spec in specs:
+            created = spec.table_name not in failed_tables
+            if created:
+                self._remember_exists(spec.table_name, True)
+                logger.info(f"Created external table: {self._table_ref_prefix}{spec.table_name}")
+            results.append(created)
+        return results
+
+    @_handle_bq_errors("creating tables", default=None)
+    def _create_tables_in_one_job(self, script: str) -> Optional[Set[str]]:
+        """Run create_external_tables' batch script.
+
+        Returns:
+            Names of tables that were not created, or None if the job itself failed
+        """
+        return self._script_failures(script, "creating table")
+
+    def _external_table_ddl(
+        self,
+        spec: ExternalTableSpec,
+        schema: Optional[List[bigquery.SchemaField]],
+        has_title_row: bool,
+        max_staleness: str,
+        metadata_cache_mode: str,
+    ) -> str:
+        """Build the CREATE EXTERNAL TABLE statement for one spec.
+
+        Mirrors the options create_external_table sets through the API.
+        Omitting the column list lets BigQuery autodetect the schema.
+        """
+        source_uri_prefix, source_uris = self._source_uris(spec.storage_folder_name, spec.use_hive_partitioning)
+
+        ddl = f"CREATE EXTERNAL TABLE `{self._table_ref_prefix}{spec.table_name}`"
+        if schema:
+            columns = ", ".join(f"`{field.name}` {field.field_type}" for field in schema)
+            ddl += f" ({columns})"
+        if spec.use_hive_partitioning:
+            ddl += " WITH PARTITION COLUMNS"
+        if self.connection_id:
+            ddl += f" WITH CONNECTION `{self.connection_id}`"
+
+        options = [
+            "format = 'CSV'",
+            "compression = 'GZIP'",
+            f"uris = [{', '.join(_sql_string(uri) for uri in source_uris)}]",
+            f"skip_leading_rows = {spec.header_rows + (1 if has_title_row else 0)}",
+        ]
+        if spec.use_hive_partitioning:
+            options.append(f"hive_partition_uri_prefix = {_sql_string(source_uri_prefix)}")
+        if self.connection_id:
+            options.append(f"max_staleness = INTERVAL {_sql_string(max_staleness)} YEAR TO SECOND")
+            options.append(f"metadata_cache_mode = {_sql_string(metadata_cache_mode)}")
+
+        return f"{ddl} OPTIONS ({', '.join(options)})"
+
+    @_handle_bq_errors("checking table existence", default=False)
     def table_exists(self, table_name: str) -> bool:
         """Check if table exists in dataset.
 
+        Results are cached for TABLE_EXISTS_TTL_SECONDS and kept current by
+        create_external_table and delete_table. Use invalidate_cache() when the
+        dataset may have been changed by another process.
+
         Args:
             table_name: Name of table to check
 
         Returns:
             True if table exists, False otherwise
         """
+        if not _is_valid_table_name(table_name):
+            return False
+
+        cached = self._exists_cache.get(table_name)
+        if cached is not None and time.monotonic() - cached[1] < self.TABLE_EXISTS_TTL_SECONDS:
+            return cached[0]
+
         try:
-            table_ref = f"{self.project_id}.{self._dataset_id}.{table_name}"
-            self.bq_client.get_table(table_ref)
-            return True
+            self.bq_client.get_table(self._table_ref_prefix + table_name)
         except google_api_exceptions.NotFound:
+            # Expected outcome: cache it quietly
+            self._remember_exists(table_name, False)
             return False
-        except Exception as e:
-            logger.error(f"Error checking table existence: {e}", exc_info=True)
-            return False
 
+        self._remember_exists(table_name, True)
+        return True
+
+    @_handle_bq_errors("deleting table", default=False)
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
     def delete_table(self, table_name: str) -> bool:
         """Delete a BigQuery external table.
@@ -341,21 +957,143 @@ class BigQueryManager(AnalyticsProvider):
         if self._has_error:
             return False
 
+        if not _is_valid_table_name(table_name):
+            logger.error(f"Invalid BigQuery table name: {table_name!r}")
+            return False
+
+        table_ref = self._table_ref_prefix + table_name
         try:
-            table_ref = f"{self.project_id}.{self._dataset_id}.{table_name}"
             self.bq_client.delete_table(table_ref)
-            logger.info(f"Deleted external table: {table_ref}")
-            return True
-
         except google_api_exceptions.NotFound:
+            self._remember_exists(table_name, False)
             logger.error(f"Table not found: {table_name}")
             return False
-        except google_api_exceptions.PermissionDenied as e:
-            logger.error(f"Permission denied deleting table: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Error deleting table: {e}", exc_info=True)
-            return False
+
+        self._remember_exists(table_name, False)
+        logger.info(f"Deleted external table: {table_ref}")
+        return True
+
+    def delete_tables(self, table_names: List[str]) -> Dict[str, bool]:
+        """Delete many external tables with a single multi-statement job.
+
+        Each DROP runs in its own exception block so one failure (e.g., a table
+        that no longer exists) does not abort the rest. Scripts over BigQuery's
+        query length limit fall back to one delete_table call per table.
+
+        Args:
+            table_names: Names of tables to delete
+
+        Returns:
+            Mapping of table name to True if deleted, False otherwise
+
+        Example:
+            >>> manager.delete_tables(["claim_raw_v1_0", "claim_raw_v1_1"])
+            {'claim_raw_v1_0': True, 'claim_raw_v1_1': True}
+        """
+        if self._has_error:
+            return {table_name: False for table_name in table_names}
+
+        invalid_names = {table_name for table_name in table_names if not _is_valid_table_name(table_name)}
+        if invalid_names:
+            logger.error(f"Invalid BigQuery table names: {sorted(invalid_names)}")
+            results = dict.fromkeys(invalid_names, False)
+            results.update(self.delete_tables([name for name in table_names if name not in invalid_names]))
+            return {table_name: results[table_name] for table_name in table_names}
+
+        if len(table_names) <= 1:
+            return {table_name: self.delete_table(table_name) for table_name in table_names}
+
+        statements = [
+            f"BEGIN\n  DROP EXTERNAL TABLE `{self._table_ref_prefix}{table_name}`;\n"
+            "EXCEPTION WHEN ERROR THEN\n"
+            f"  SET failures = ARRAY_CONCAT(failures, [STRUCT({_sql_string(table_name)} AS table_name, "
+            "@@error.message AS message)]);\n"
+            "END;"
+            for table_name in table_names
+        ]
+        script = self._batch_script(statements)
+
+        if len(script) > self.MAX_QUERY_LENGTH:
+            logger.debug(f"Drop script is {len(script)} characters, deleting {len(table_names)} tables one at a time")
+            return {table_name: self.delete_table(table_name) for table_name in table_names}
+
+        failed_tables = self._drop_tables_in_one_job(script)
+        if failed_tables is None:
+            return {table_name: False for table_name in table_names}
+
+        results = {}
+        for table_name in table_names:
+            deleted = table_name not in failed_tables
+            if deleted:
+                self._remember_exists(table_name, False)
+                logger.info(f"Deleted external table: {self._table_ref_prefix}{table_name}")
+            else:
+                self.invalidate_cache(table_name)
+            results[table_name] = deleted
+        return results
+
+    @_handle_bq_errors("deleting tables", default=None)
+    def _drop_tables_in_one_job(self, script: str) -> Optional[Set[str]]:
+        """Run delete_tables' batch script.
+
+        Returns:
+            Names of tables that were not deleted, or None if the job itself failed
+        """
+        return self._script_failures(script, "deleting table")
+
+    @staticmethod
+    def _batch_script(statements: List[str]) -> str:
+        """Wrap per-table statements into a script that reports failures instead of aborting.
+
+        Each statement must append to the declared `failures` array in its exception block.
+        """
+        return "\n".join(
+            [
+                "DECLARE failures ARRAY<STRUCT<table_name STRING, message STRING>> DEFAULT [];",
+                *statements,
+                "SELECT f.table_name, f.message FROM UNNEST(failures) AS f;",
+            ]
+        )
+
+    def _script_failures(self, script: str, action: str) -> Set[str]:
+        """Run a _batch_script and log each table-level failure it reports.
+
+        Returns:
+            Names of tables whose statement failed
+        """
+        failed_tables = set()
+        for row in self.bq_client.query(script).result():
+            logger.error(f"Error {action} {row.table_name}: {row.message}")
+            failed_tables.add(row.table_name)
+        return failed_tables
+
+    def _remember_exists(self, table_name: str, exists: bool) -> None:
+        """Record a known table existence state in the table_exists cache."""
+        self._exists_cache[table_name] = (exists, time.monotonic())
+
+    @functools.cached_property
+    def storage_client(self) -> storage.Client:
+        """GCS client used for schema inference, created on first use.
+
+        Managers that only list, check or delete tables never build it.
+        """
+        return _get_storage_client(self.project_id)
+
+    @staticmethod
+    def clear_schema_cache() -> None:
+        """Forget inferred schemas (e.g., after the CSV files in a folder change)."""
+        _schema_cache.clear()
+
+    def invalidate_cache(self, table_name: Optional[str] = None) -> None:
+        """Forget cached table_exists results.
+
+        Args:
+            table_name: Table to forget, or None to clear the whole cache
+        """
+        if table_name is None:
+            self._exists_cache.clear()
+        else:
+            self._exists_cache.pop(table_name, None)
 
     @property
     def has_error(self) -> bool:
@@ -0,0 +1,30 @@
+"""HTTP connection pool tuning for Google Cloud clients."""
+
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+
+# requests defaults to 10 pooled connections per host, which throttles
+# concurrent metadata and upload calls issued from thread pools
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 64
+
+
+def mount_pooled_adapter(
+    client: Any,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> None:
+    """Replace a client's HTTPS adapter with a larger keep-alive connection pool.
+
+    Args:
+        client: google-cloud client exposing its authorized requests session as `_http`
+        pool_connections: Number of host pools to cache (default: 32)
+        pool_maxsize: Maximum connections kept alive per host (default: 64)
+
+    Example:
+        >>> client = bigquery.Client(project="my-project")
+        >>> mount_pooled_adapter(client)
+    """
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    client._http.mount("https://", adapter)
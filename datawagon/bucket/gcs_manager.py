@@ -6,21 +6,26 @@ metadata. Includes retry logic for transient failures and security validation.
 """
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-import pandas as pd
 from google.api_core import exceptions as google_api_exceptions
 from google.cloud import storage  # type: ignore[attr-defined]
 
-from datawagon.bucket.retry_utils import retry_with_backoff
+from datawagon.bucket.client_utils import mount_pooled_adapter
+from datawagon.bucket.retry_utils import TokenBucket, retry_with_backoff
 from datawagon.bucket.storage_provider import StorageProvider
 from datawagon.logging_config import get_logger
 from datawagon.objects.source_config import SourceConfig
 from datawagon.security import SecurityError, validate_blob_name
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 # GCS transient failures that should be retried
@@ -31,6 +36,45 @@ TRANSIENT_EXCEPTIONS = (
     google_api_exceptions.TooManyRequests,  # 429 rate limiting
 )
 
+# Objects per list request (the GCS maximum); fewer pages mean fewer round trips
+_LIST_PAGE_SIZE = 1000
+
+# Partial-response mask for listings that only read blob names
+_NAME_ONLY_FIELDS = "items(name),nextPageToken"
+
+# Files at or above this size upload in resumable chunks; smaller ones use one request
+_RESUMABLE_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+# Resumable chunk size (multiple of 256 KiB); a transient failure resends one chunk, not the file
+_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Split points for sharded prefix listings, in code point order (digits, upper, "_", lower)
+_SHARD_SPLIT_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+
+# Characters with special meaning in a GCS match_glob
+_GLOB_CHARS = frozenset("*?[]{}\\")
+
+# How long a list_blobs / list_all_blobs_with_prefix result is reused
+_LIST_CACHE_TTL = 30.0
+
+
+@lru_cache(maxsize=4096)
+def _validated_blob_name(blob_name: str) -> str:
+    """Memoized validate_blob_name so retried uploads/copies skip re-validation.
+
+    SecurityError propagates and is never cached.
+    """
+    return validate_blob_name(blob_name)
+
+
+def _is_unexpected(error: Exception) -> bool:
+    """Whether an error warrants a traceback in logs.
+
+    GCS API errors (including throttling and 5xx responses that recur under
+    load) are fully described by their message; formatting a traceback for
+    each one only adds cost and log volume.
+    """
+    return not isinstance(error, google_api_exceptions.GoogleAPIError)
+
 
 class GcsManager(StorageProvider):
     """Google Cloud Storage implementation of StorageProvider.
@@ -42,30 +86,60 @@ class GcsManager(StorageProvider):
     Attributes:
         storage_client: GCS storage client
         source_bucket_name: Name of the GCS bucket to operate on
+        max_workers: Maximum concurrent list requests in files_in_blobs_df
+        rate_limit: Maximum GCS requests started per second across all threads
         has_error: Flag indicating if initialization encountered errors
     """
 
-    def __init__(self, gcs_project: str, source_bucket_name: str) -> None:
+    # Default number of concurrent per-source listings in files_in_blobs_df
+    DEFAULT_MAX_WORKERS = 8
+
+    # Default request rate cap (requests/second, also the burst size)
+    DEFAULT_RATE_LIMIT = 200.0
+
+    def __init__(
+        self,
+        gcs_project: str,
+        source_bucket_name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+    ) -> None:
         """Initialize GCS manager and verify access.
 
-        Creates GCS client, lists available buckets to verify authentication,
+        Creates GCS client with a pooled keep-alive transport, fetches the target bucket to verify authentication,
         and sets error flag if connection fails.
 
         Args:
             gcs_project: GCP project ID
             source_bucket_name: Name of GCS bucket to use
+            max_workers: Maximum concurrent list requests in files_in_blobs_df (default: 8)
+            rate_limit: Maximum list/upload/copy requests started per second (default: 200)
 
         Note:
             Sets has_error=True if authentication or permissions fail.
             Run 'gcloud auth application-default login' if authentication fails.
         """
         self.storage_client = storage.Client(project=gcs_project)
+        # Keep connections alive across the concurrent list/upload calls
+        mount_pooled_adapter(self.storage_client)
         self.source_bucket_name = source_bucket_name
+        # Bucket handles carry no per-request state, so one is shared by all methods and threads
+        self._bucket = self.storage_client.bucket(source_bucket_name)
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        # Shared by every thread so fan-out (upload_many, files_in_blobs_df) can't exceed quota in bursts
+        self._rate_limiter = TokenBucket(rate=rate_limit, burst=rate_limit)
         self._has_error = False
+        # (bucket, prefix, match_glob) -> (listed_at, blob names); match_glob is None for prefix listings
+        self._list_cache: Dict[Tuple[str, str, Optional[str]], Tuple[float, List[str]]] = {}
+        self._cache_lock = threading.Lock()
         try:
-            existing_buckets = self.storage_client.list_buckets()
-            for bucket in existing_buckets:
-                logger.info(f"Found GCS bucket: {bucket.name}")
+            # One GET on the target bucket verifies access without paging through every bucket in the project
+            self._bucket.reload()
+            logger.info(f"Found GCS bucket: {source_bucket_name}")
+        except google_api_exceptions.NotFound:
+            # Listings treat a missing bucket as empty, so this is not fatal here
+            logger.warning(f"GCS bucket not found: {source_bucket_name}")
         except google_api_exceptions.Unauthenticated as e:
             logger.error(f"GCS authentication failed: {e}")
             logger.error("Authentication required. Run: gcloud auth application-default login")
@@ -86,32 +160,91 @@ class GcsManager(StorageProvider):
         buckets = self.storage_client.list_buckets()
         return [bucket.name for bucket in buckets]
 
+    def iter_blob_names(
+        self, storage_folder_name: str, file_name_base: str, file_extension: str, page_size: int = _LIST_PAGE_SIZE
+    ) -> Iterator[str]:
+        """Yield names of blobs matching pattern as each listing page arrives.
+
+        Lets callers start work on the first page before the last one is fetched
+        and avoids holding every name at once. Unlike list_blobs, GCS errors
+        propagate to the caller without retry.
+
+        Args:
+            storage_folder_name: Storage folder (e.g., "caravan/claim_raw")
+            file_name_base: File name glob base (e.g., "YouTube_*")
+            file_extension: File extension (e.g., ".csv.gz")
+            page_size: Objects per list request (default: 1000)
+
+        Yields:
+            Full blob names
+
+        Example:
+            >>> for name in manager.iter_blob_names("caravan/claim_raw", "YouTube_*", ".csv.gz"):
+            ...     print(name)
+        """
+        if self._has_error:
+            logger.error("GCS client has errors, cannot list blobs")
+            return
+
+        parent_prefix, match_glob = self._glob_query(storage_folder_name, file_name_base, file_extension)
+        self._rate_limiter.acquire()
+        blobs = self.storage_client.list_blobs(
+            self.source_bucket_name,
+            prefix=parent_prefix,
+            match_glob=match_glob,
+            page_size=page_size,
+            fields=_NAME_ONLY_FIELDS,
+        )
+        for blob in blobs:
+            yield blob.name
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _glob_query(storage_folder_name: str, file_name_base: str, file_extension: str) -> Tuple[str, str]:
+        """Build the (prefix, match_glob) pair used to list a source's files (memoized per source)."""
+        # Extract parent directory for efficient search
+        if "/" in storage_folder_name:
+            parts = storage_folder_name.rsplit("/", 1)
+            parent_prefix = parts[0] + "/"
+            folder_base = parts[1]
+        else:
+            parent_prefix = ""
+            folder_base = storage_folder_name
+
+        # Search with glob that matches both:
+        # - caravan/claim_raw/report_date=*/file.csv.gz
+        # - caravan/claim_raw_v1-0/report_date=*/file.csv.gz
+        match_glob = f"**{folder_base}*/**{file_name_base}**{file_extension}"
+
+        # Both layouts start with the literal folder name, so a plain folder narrows the server-side
+        # prefix scan to it; the glob still filters versioned suffixes. Wildcard folders (e.g. a
+        # select_file_name_base fallback) can't be used as a prefix.
+        if not _GLOB_CHARS.intersection(folder_base):
+            return parent_prefix + folder_base, match_glob
+        return parent_prefix, match_glob
+
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
-    def list_blobs(self, storage_folder_name: str, file_name_base: str, file_extension: str) -> List[str]:
-        """List blobs matching pattern with proper error propagation."""
+    def list_blobs(
+        self, storage_folder_name: str, file_name_base: str, file_extension: str, page_size: int = _LIST_PAGE_SIZE
+    ) -> List[str]:
+        """List blobs matching pattern with proper error propagation.
+
+        Results are reused for up to 30 seconds; uploads and copies through this
+        manager invalidate overlapping entries.
+        """
         if self._has_error:
             logger.error("GCS client has errors, cannot list blobs")
             return []
 
+        cache_key = (self.source_bucket_name, *self._glob_query(storage_folder_name, file_name_base, file_extension))
+        cached = self._cached_listing(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Extract parent directory for efficient search
-            if "/" in storage_folder_name:
-                parts = storage_folder_name.rsplit("/", 1)
-                parent_prefix = parts[0] + "/"
-                folder_base = parts[1]
-            else:
-                parent_prefix = ""
-                folder_base = storage_folder_name
-
-            # Search with glob that matches both:
-            # - caravan/claim_raw/report_date=*/file.csv.gz
-            # - caravan/claim_raw_v1-0/report_date=*/file.csv.gz
-            blobs = self.storage_client.list_blobs(
-                self.source_bucket_name,
-                prefix=parent_prefix,
-                match_glob=f"**{folder_base}*/**{file_name_base}**{file_extension}",
-            )
-            return [blob.name for blob in blobs]
+            blob_names = list(self.iter_blob_names(storage_folder_name, file_name_base, file_extension, page_size))
+            self._store_listing(cache_key, blob_names)
+            return blob_names
 
         except google_api_exceptions.NotFound:
             # Bucket not found - return empty (expected case)
@@ -128,21 +261,22 @@ class GcsManager(StorageProvider):
             raise  # Re-raise to signal caller
 
         except Exception as e:
-            # Other errors - log with full trace and return empty
-            logger.error(f"Unable to list files in bucket: {e}", exc_info=True)
+            # Other errors - return empty; only non-API errors (likely bugs) get a traceback
+            logger.error(f"Unable to list files in bucket: {e}", exc_info=_is_unexpected(e))
             return []
 
-    def files_in_blobs_df(self, source_confg: SourceConfig) -> pd.DataFrame:
+    def files_in_blobs_df(self, source_confg: SourceConfig) -> "pd.DataFrame":
         """Get DataFrame of files in bucket for all enabled sources.
 
-        Lists files in bucket matching each enabled source configuration and
-        combines into a single DataFrame.
+        Lists files in bucket matching each enabled source configuration
+        (concurrently, up to max_workers at a time) and combines into a single
+        DataFrame.
 
         Args:
             source_confg: Source configuration with enabled file sources
 
         Returns:
-            DataFrame with columns: _file_name, base_name
+            DataFrame with columns: _file_name, base_name (categorical)
 
         Example:
             >>> df = manager.files_in_blobs_df(config)
@@ -151,30 +285,44 @@ class GcsManager(StorageProvider):
             0  file1.csv.gz           YouTube_*
             1  file2.csv.gz           YouTube_*
         """
-        combined_df = pd.DataFrame(columns=["_file_name", "base_name"])
-
-        for file_id in source_confg.file:
-            file_source = source_confg.file[file_id]
-            if file_source.is_enabled:
-                blob_list = self.list_blobs(
-                    file_source.storage_folder_name or file_source.select_file_name_base,
-                    file_source.select_file_name_base,
-                    ".csv.gz",
-                )
-
-                file_list = []
-                for blob in blob_list:
-                    # remove the base_prefix and file_extension from the blob name
-                    # to prevent duplicate files
-                    file_list.append(os.path.basename(blob))
-
-                df = pd.DataFrame(file_list, columns=["_file_name"])
-                df["base_name"] = file_source.select_file_name_base
-
-                # FIX: Reset index to prevent duplicate indices after concat
-                combined_df = pd.concat([combined_df, df], ignore_index=True)
-
-        return combined_df
+        # pandas is only needed here, so CLI commands that never build this frame don't pay for its import
+        import pandas as pd
+
+        enabled_sources = [file_source for file_source in source_confg.file.values() if file_source.is_enabled]
+        if not enabled_sources:
+            return pd.DataFrame(columns=["_file_name", "base_name"])
+
+        # Sources sharing a folder and base pattern issue one listing between them
+        queries = [
+            (file_source.storage_folder_name or file_source.select_file_name_base, file_source.select_file_name_base)
+            for file_source in enabled_sources
+        ]
+        unique_queries = list(dict.fromkeys(queries))
+
+        def query_file_names(query: Tuple[str, str]) -> List[str]:
+            blob_list = self.list_blobs(query[0], query[1], ".csv.gz")
+
+            # remove the base_prefix and file_extension from the blob name
+            # to prevent duplicate files (GCS names always use "/", whatever the host OS)
+            return [blob.rpartition("/")[2] for blob in blob_list]
+
+        # Each listing is a network round trip; run them concurrently
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_queries))) as executor:
+            names_by_query = dict(zip(unique_queries, executor.map(query_file_names, unique_queries)))
+        names_per_source = [names_by_query[query] for query in queries]
+
+        # Build both columns as flat lists and construct the frame once (no per-source frames or concat).
+        # base_name repeats one value per source, so store it as categorical codes rather than strings.
+        file_names: List[str] = []
+        base_codes: List[int] = []
+        categories: Dict[str, int] = {}
+        for file_source, names in zip(enabled_sources, names_per_source):
+            code = categories.setdefault(file_source.select_file_name_base, len(categories))
+            file_names.extend(names)
+            base_codes.extend([code] * len(names))
+
+        base_names = pd.Categorical.from_codes(base_codes, categories=list(categories))
+        return pd.DataFrame({"_file_name": file_names, "base_name": base_names})
 
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
     def upload_blob(self, source_file_name: str, destination_blob_name: str, overwrite: bool = False) -> bool:
@@ -182,7 +330,8 @@ class GcsManager(StorageProvider):
 
         Validates blob name for security, then uploads file to GCS with automatic
         retry for transient failures (503, 504, 500, 429). Uses atomic operations
-        to prevent race conditions when overwrite=False.
+        to prevent race conditions when overwrite=False. Files of 32 MiB or more
+        use a chunked resumable upload so a failed chunk is resent on its own.
 
         Args:
             source_file_name: Local file path to upload
@@ -199,24 +348,24 @@ class GcsManager(StorageProvider):
             >>> manager.upload_blob("/data/file.csv.gz", "youtube/report_date=2023-06-30/file.csv.gz")
             True
         """
-        # Get file size for metrics
-        file_path = Path(source_file_name)
-        file_size_bytes = file_path.stat().st_size
-        file_size_mb = file_size_bytes / (1024 * 1024)
+        # Get file size for verification and metrics
+        file_size_bytes = os.stat(source_file_name).st_size
 
         # Start timing
         start_time = time.perf_counter()
 
         # Validate blob name for security
         try:
-            validated_destination = validate_blob_name(destination_blob_name)
+            validated_destination = _validated_blob_name(destination_blob_name)
         except SecurityError as e:
             logger.error(f"Invalid blob name: {e}")
             raise ValueError(f"Invalid destination blob name: {e}")
 
         try:
-            bucket = self.storage_client.bucket(self.source_bucket_name)
-            blob = bucket.blob(validated_destination)
+            self._rate_limiter.acquire()
+            bucket = self._bucket
+            chunk_size = _UPLOAD_CHUNK_SIZE if file_size_bytes >= _RESUMABLE_UPLOAD_THRESHOLD else None
+            blob = bucket.blob(validated_destination, chunk_size=chunk_size)
 
             # FIX: Use atomic create-if-not-exists to prevent race conditions
             # if_generation_match=0 means only succeed if blob doesn't exist
@@ -224,8 +373,7 @@ class GcsManager(StorageProvider):
 
             blob.upload_from_filename(source_file_name, if_generation_match=generation_match)
 
-            # Verify upload integrity
-            blob.reload()
+            # Verify upload integrity (the upload response already populated blob metadata)
             if blob.size != file_size_bytes:
                 logger.error(
                     f"Upload verification failed: local={file_size_bytes}B, "
@@ -233,8 +381,11 @@ class GcsManager(StorageProvider):
                 )
                 return False
 
+            self.invalidate_list_cache(validated_destination)
+
             # Calculate metrics
             duration = time.perf_counter() - start_time
+            file_size_mb = file_size_bytes / (1024 * 1024)
             throughput = file_size_mb / duration if duration > 0 else 0
 
             logger.info(
@@ -256,9 +407,52 @@ class GcsManager(StorageProvider):
             return False
         except Exception as e:
             duration = time.perf_counter() - start_time
-            logger.error(f"Unable to upload file after {duration:.2f}s to bucket: {e}", exc_info=True)
+            logger.error(f"Unable to upload file after {duration:.2f}s to bucket: {e}", exc_info=_is_unexpected(e))
             return False
 
+    def upload_many(
+        self, pairs: List[Tuple[str, str]], *, max_concurrency: int = 16, overwrite: bool = False
+    ) -> List[bool]:
+        """Upload many files concurrently.
+
+        Each file goes through upload_blob, so per-file validation, retry and
+        integrity checks still apply. Uploads are network-bound, so up to
+        max_concurrency of them run at once. A failing file (bad name, missing
+        local file) yields False for that pair rather than aborting the batch.
+
+        Args:
+            pairs: (source_file_name, destination_blob_name) tuples
+            max_concurrency: Maximum uploads in flight (default: 16)
+            overwrite: Passed to upload_blob for every file
+
+        Returns:
+            One success flag per pair, in input order
+
+        Example:
+            >>> manager.upload_many([
+            ...     ("/data/a.csv.gz", "youtube/report_date=2023-06-30/a.csv.gz"),
+            ...     ("/data/b.csv.gz", "youtube/report_date=2023-07-31/b.csv.gz"),
+            ... ])
+            [True, True]
+        """
+        if not pairs:
+            return []
+
+        def upload(pair: Tuple[str, str]) -> bool:
+            source_file_name, destination_blob_name = pair
+            try:
+                return bool(self.upload_blob(source_file_name, destination_blob_name, overwrite=overwrite))
+            except ValueError:
+                # Invalid destination name (already logged); don't abort the batch
+                return False
+            except OSError as e:
+                # Unreadable local file; report it for this pair and keep the batch going
+                logger.error(f"Unable to read {source_file_name} for upload: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pairs))) as executor:
+            return list(executor.map(upload, pairs))
+
     # 10/2/23 - all four of these functions are currently unused
     def delete_blob(self, blob_name: str) -> None:
         """Delete a blob from the bucket.
@@ -266,7 +460,7 @@ class GcsManager(StorageProvider):
         Args:
             blob_name: Name of blob to delete
         """
-        bucket = self.storage_client.bucket(self.source_bucket_name)
+        bucket = self._bucket
         blob = bucket.blob(blob_name)
         blob.delete()
 
@@ -291,7 +485,7 @@ class GcsManager(StorageProvider):
         Returns:
             storage.Blob object
         """
-        bucket = self.storage_client.bucket(self.source_bucket_name)
+        bucket = self._bucket
         blob = bucket.blob(blob_name)
         return blob
 
@@ -306,77 +500,186 @@ class GcsManager(StorageProvider):
         blob.download_to_filename(destination_file_name)
 
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
-    def copy_blob_within_bucket(self, source_blob_name: str, destination_blob_name: str) -> bool:
-        """Copy a blob to a new location within the same bucket with atomic verification."""
-        if not self._has_error:
+    def copy_blob_within_bucket(
+        self, source_blob_name: str, destination_blob_name: str, source_size: Optional[int] = None
+    ) -> bool:
+        """Copy a blob to a new location within the same bucket with atomic verification.
+
+        The copy response already carries the destination's metadata, so only the
+        source needs fetching for verification. Pass source_size (e.g. from a prior
+        listing) to skip that fetch.
+
+        Args:
+            source_blob_name: Existing blob to copy
+            destination_blob_name: Target blob name
+            source_size: Known source size in bytes, if any (default: fetched)
+
+        Returns:
+            True if the destination matches the source size, False otherwise
+        """
+        if self._has_error:
+            logger.error("GCS client has errors, cannot copy blobs")
+            return False
+
+        try:
+            # Validate destination path before attempting copy
             try:
-                # Validate destination path before attempting copy
-                try:
-                    validate_blob_name(destination_blob_name)
-                except SecurityError as e:
-                    logger.error(f"Invalid destination blob name: {e}")
-                    return False
+                _validated_blob_name(destination_blob_name)
+            except SecurityError as e:
+                logger.error(f"Invalid destination blob name: {e}")
+                return False
 
-                # Log the copy operation
-                logger.info(f"Attempting copy: {source_blob_name} -> {destination_blob_name}")
+            # Log the copy operation
+            logger.info(f"Attempting copy: {source_blob_name} -> {destination_blob_name}")
+            self._rate_limiter.acquire()
 
-                bucket = self.storage_client.bucket(self.source_bucket_name)
-                source_blob = bucket.blob(source_blob_name)
+            bucket = self._bucket
+            source_blob = bucket.blob(source_blob_name)
 
-                # Fetch source blob metadata from GCS (required for size comparison)
+            if source_size is None:
                 source_blob.reload()
-                logger.debug(f"Source blob size: {source_blob.size} bytes")
-
-                # Copy blob within same bucket - returns new blob with metadata
-                destination_blob = bucket.copy_blob(source_blob, bucket, destination_blob_name)
-
-                # Reload destination blob to get fresh metadata from GCS
-                destination_blob.reload()
-                logger.debug(f"Destination blob created with size: {destination_blob.size} bytes")
-
-                # FIX: Verify immediately using returned object (no TOCTOU gap)
-                # Compare sizes to ensure copy completed successfully
-                if destination_blob.size == source_blob.size:
-                    logger.info(
-                        f"Copied: {source_blob_name} -> {destination_blob_name} " f"({destination_blob.size} bytes)"
-                    )
-                    return True
-                else:
-                    logger.error(
-                        f"Size mismatch: source={source_blob_name} "
-                        f"({source_blob.size}B) dest={destination_blob_name} "
-                        f"({destination_blob.size}B)"
-                    )
-                    return False
-
-            except google_api_exceptions.NotFound as e:
-                logger.error(f"Source blob not found: {e}")
-                return False
-            except google_api_exceptions.PermissionDenied as e:
-                logger.error(f"Permission denied copying blob: {e}")
-                return False
-            except Exception as e:
-                logger.error(f"Error copying blob: {e}", exc_info=True)
+                source_size = source_blob.size
+
+            # Copy blob within same bucket - returns new blob with metadata
+            destination_blob = bucket.copy_blob(source_blob, bucket, destination_blob_name)
+            logger.debug(f"Source blob size: {source_size} bytes")
+            logger.debug(f"Destination blob created with size: {destination_blob.size} bytes")
+
+            # FIX: Verify immediately using returned object (no TOCTOU gap)
+            # Compare sizes to ensure copy completed successfully
+            self.invalidate_list_cache(destination_blob_name)
+            if destination_blob.size == source_size:
+                logger.info(
+                    f"Copied: {source_blob_name} -> {destination_blob_name} " f"({destination_blob.size} bytes)"
+                )
+                return True
+            else:
+                logger.error(
+                    f"Size mismatch: source={source_blob_name} "
+                    f"({source_size}B) dest={destination_blob_name} "
+                    f"({destination_blob.size}B)"
+                )
                 return False
-        return False
+
+        except google_api_exceptions.NotFound as e:
+            logger.error(f"Source blob not found: {e}")
+            return False
+        except google_api_exceptions.PermissionDenied as e:
+            logger.error(f"Permission denied copying blob: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error copying blob: {e}", exc_info=_is_unexpected(e))
+            return False
 
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
-    def list_all_blobs_with_prefix(self, prefix: str = "") -> List[str]:
-        """List all blobs in bucket with given prefix."""
-        if not self._has_error:
-            try:
-                blobs = self.storage_client.list_blobs(self.source_bucket_name, prefix=prefix)
+    def list_all_blobs_with_prefix(
+        self, prefix: str = "", page_size: int = _LIST_PAGE_SIZE, shards: int = 1
+    ) -> List[str]:
+        """List all blobs in bucket with given prefix (reused for up to 30 seconds).
+
+        GCS pages through a listing sequentially, so very large prefixes can be
+        split into disjoint name ranges (start_offset/end_offset) listed
+        concurrently. Names come back in the same sorted order either way.
+
+        Args:
+            prefix: Blob name prefix (default: whole bucket)
+            page_size: Objects per list request (default: 1000)
+            shards: Number of name ranges to list in parallel (default: 1)
+
+        Returns:
+            Sorted blob names under the prefix
+
+        Example:
+            >>> manager.list_all_blobs_with_prefix("caravan-versioned/", shards=8)
+        """
+        if self._has_error:
+            logger.error("GCS client has errors, cannot list blobs")
+            return []
+
+        cache_key = (self.source_bucket_name, prefix, None)
+        cached = self._cached_listing(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            ranges = self._shard_ranges(prefix, shards)
+
+            def list_range(bounds: Tuple[Optional[str], Optional[str]]) -> List[str]:
+                self._rate_limiter.acquire()
+                blobs = self.storage_client.list_blobs(
+                    self.source_bucket_name,
+                    prefix=prefix,
+                    start_offset=bounds[0],
+                    end_offset=bounds[1],
+                    page_size=page_size,
+                    fields=_NAME_ONLY_FIELDS,
+                )
                 return [blob.name for blob in blobs]
-            except google_api_exceptions.NotFound as e:
-                logger.error(f"Bucket not found: {e}")
-                return []
-            except google_api_exceptions.PermissionDenied as e:
-                logger.error(f"Permission denied listing blobs: {e}")
-                return []
-            except Exception as e:
-                logger.error(f"Error listing blobs: {e}", exc_info=True)
-                return []
-        return []
+
+            if len(ranges) == 1:
+                blob_names = list_range(ranges[0])
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as executor:
+                    blob_names = [name for names in executor.map(list_range, ranges) for name in names]
+            self._store_listing(cache_key, blob_names)
+            return blob_names
+        except google_api_exceptions.NotFound as e:
+            logger.error(f"Bucket not found: {e}")
+            return []
+        except google_api_exceptions.PermissionDenied as e:
+            logger.error(f"Permission denied listing blobs: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error listing blobs: {e}", exc_info=_is_unexpected(e))
+            return []
+
+    @staticmethod
+    def _shard_ranges(prefix: str, shards: int) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Split the names under a prefix into contiguous [start, end) offset ranges.
+
+        Split points are spread over the characters blob names usually contain;
+        the first range is open below and the last open above, so every name
+        falls in exactly one range.
+        """
+        count = max(1, min(shards, len(_SHARD_SPLIT_CHARS) + 1))
+        step = len(_SHARD_SPLIT_CHARS) / count
+        splits = [prefix + _SHARD_SPLIT_CHARS[int(i * step)] for i in range(1, count)]
+        starts: List[Optional[str]] = [None, *splits]
+        ends: List[Optional[str]] = [*splits, None]
+        return list(zip(starts, ends))
+
+    def _cached_listing(self, cache_key: Tuple[str, str, Optional[str]]) -> Optional[List[str]]:
+        """Return a copy of a fresh cached listing, or None."""
+        with self._cache_lock:
+            entry = self._list_cache.get(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < _LIST_CACHE_TTL:
+            return list(entry[1])
+        return None
+
+    def _store_listing(self, cache_key: Tuple[str, str, Optional[str]], blob_names: List[str]) -> None:
+        """Cache a listing result (a copy, so callers may mutate theirs)."""
+        if self._has_error:
+            return
+        with self._cache_lock:
+            self._list_cache[cache_key] = (time.monotonic(), list(blob_names))
+
+    def invalidate_list_cache(self, prefix: Optional[str] = None) -> None:
+        """Forget cached listings that could include objects under a prefix.
+
+        Args:
+            prefix: Blob name or prefix that changed, or None to clear the whole cache
+
+        Example:
+            >>> manager.invalidate_list_cache("caravan/claim_raw/report_date=2023-06-30/file.csv.gz")
+        """
+        with self._cache_lock:
+            if prefix is None:
+                self._list_cache.clear()
+                return
+            for cache_key in list(self._list_cache):
+                listed_prefix = cache_key[1]
+                if prefix.startswith(listed_prefix) or listed_prefix.startswith(prefix):
+                    del self._list_cache[cache_key]
 
     def read_blob_to_memory(self, blob_name: str) -> BytesIO:
         """Read blob contents into memory.
@@ -1,25 +1,58 @@
-"""Retry decorator with exponential backoff for transient failures."""
+"""Retry decorator with exponential backoff for transient failures.
 
+Also provides a token bucket for capping request rates when calls fan out
+across threads.
+"""
+
+import asyncio
 import functools
+import inspect
+import random
+import threading
 import time
-from typing import Callable, Tuple, Type
+from typing import Callable, Optional, Tuple, Type
 
 from datawagon.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _retry_after_seconds(exception: BaseException) -> Optional[float]:
+    """Read a Retry-After header (delta-seconds form) from an API error's HTTP response.
+
+    Returns:
+        Seconds to wait, or None if the error carries no usable header
+    """
+    response = getattr(exception, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
 def retry_with_backoff(
     retries: int = 3,
     backoff_factor: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    max_delay: float = 60.0,
+    jitter: bool = True,
 ) -> Callable:
     """Decorator to retry a function with exponential backoff.
 
+    Delays are randomized (x0.5-1.5) so concurrent callers that fail together
+    don't retry in lockstep. A Retry-After header on the error (e.g., a 429)
+    overrides the computed delay (still capped at max_delay). Coroutine functions
+    are retried with asyncio.sleep instead of blocking the thread.
+
     Args:
         retries: Maximum number of retry attempts (default: 3)
         backoff_factor: Multiplier for delay between retries (default: 2.0)
         exceptions: Tuple of exception types to catch and retry (default: all)
+        max_delay: Upper bound on any delay in seconds, Retry-After included (default: 60.0)
+        jitter: Randomize each delay (default: True)
 
     Returns:
         Decorated function that retries on transient failures
@@ -31,30 +64,110 @@ def retry_with_backoff(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
-            delay = 1.0
-            last_exception = None
+        def sleep_seconds(last_exception: Exception, delay: float) -> float:
+            sleep_for = _retry_after_seconds(last_exception)
+            if sleep_for is None:
+                return min(delay, max_delay) * (random.uniform(0.5, 1.5) if jitter else 1.0)
+            return min(sleep_for, max_delay)
 
-            for attempt in range(retries + 1):
+        if inspect.iscoroutinefunction(func):
+            # Coroutines wait with asyncio.sleep so the event loop keeps serving other tasks
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
                 try:
-                    return func(*args, **kwargs)
+                    return await func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt == retries:
-                        logger.error(f"{func.__name__} failed after {retries} retries: {e}")
-                        raise
 
+                delay = 1.0
+                for attempt in range(1, retries + 1):
+                    sleep_for = sleep_seconds(last_exception, delay)
                     logger.warning(
-                        f"{func.__name__} failed (attempt {attempt + 1}/{retries}), " f"retrying in {delay}s: {e}"
+                        f"{func.__name__} failed (attempt {attempt}/{retries}), "
+                        f"retrying in {sleep_for:.2f}s: {last_exception}"
                     )
-                    time.sleep(delay)
+                    await asyncio.sleep(sleep_for)
                     delay *= backoff_factor
 
-            # Should never reach here, but satisfy type checker
-            if last_exception:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+
+                logger.error(f"{func.__name__} failed after {retries} retries: {last_exception}")
                 raise last_exception
 
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
+            # Fast path: a successful first attempt sets up no retry bookkeeping
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
+
+            delay = 1.0
+            for attempt in range(1, retries + 1):
+                sleep_for = sleep_seconds(last_exception, delay)
+                logger.warning(
+                    f"{func.__name__} failed (attempt {attempt}/{retries}), "
+                    f"retrying in {sleep_for:.2f}s: {last_exception}"
+                )
+                time.sleep(sleep_for)
+                delay *= backoff_factor
+
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+
+            logger.error(f"{func.__name__} failed after {retries} retries: {last_exception}")
+            raise last_exception
+
         return wrapper
 
     return decorator
+
+
+class TokenBucket:
+    """Thread-safe token bucket that limits how often calls may start.
+
+    Tokens refill continuously at `rate` per second up to `burst`; acquire()
+    takes one token, sleeping until one is available.
+
+    Example:
+        >>> limiter = TokenBucket(rate=200, burst=200)
+        >>> limiter.acquire()  # before each API request
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second (sustained calls per second)
+            burst: Maximum tokens held (default: rate, minimum 1)
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(1.0, float(burst if burst is not None else rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -6,10 +6,12 @@ with column name normalization to lowercase and special character handling.
 
 import csv
 import gzip
-import re
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import List, Optional, Tuple
+from itertools import islice, zip_longest
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from google.api_core import exceptions as google_api_exceptions
 from google.cloud import bigquery, storage
@@ -27,6 +29,21 @@ TRANSIENT_EXCEPTIONS = (
     google_api_exceptions.TooManyRequests,  # 429 rate limiting
 )
 
+# Partial-response mask for listings that only read blob names
+_NAME_ONLY_FIELDS = "items(name),nextPageToken"
+
+# Byte ranges tried in turn when sampling a file's head, before downloading it whole
+_SAMPLE_RANGE_BYTES = (2 * 1024 * 1024, 16 * 1024 * 1024)
+
+# Column name characters replaced with "_" or dropped, applied in one str.translate pass
+_COLUMN_NAME_TRANSLATION = str.maketrans({" ": "_", ".": "_", "-": "_", "/": "_", "(": "_", ")": "", "?": "", ":": ""})
+
+# Values accepted as BOOL (compared lowercased)
+_BOOL_VALUES = frozenset({"true", "false", "yes", "no", "1", "0"})
+
+# Non-digit characters a value parseable by int()/float() can start with ("inf"/"nan" included)
+_NUMERIC_FIRST_CHARS = frozenset("+-.iInN")
+
 
 class SchemaInferenceManager:
     """Infer BigQuery schemas from CSV files in GCS.
@@ -41,9 +58,13 @@ class SchemaInferenceManager:
 
     # Default type inference settings
     DEFAULT_SAMPLE_SIZE = 100
+    DEFAULT_SAMPLE_BYTES = 1024 * 1024
     DEFAULT_CONFIDENCE_THRESHOLD = 0.95
     DEFAULT_MIN_NON_NULL_SAMPLES = 10
 
+    # Default number of folders inferred concurrently by infer_schemas
+    DEFAULT_MAX_WORKERS = 16
+
     # Type detection limits
     INT64_MIN = -(2**63)
     INT64_MAX = 2**63 - 1
@@ -78,28 +99,20 @@ class SchemaInferenceManager:
             ['asset_id', 'revenue__usd_', 'date']
         """
         normalized = []
+        seen = set()  # O(1) duplicate checks; same names as scanning the list
         for col in columns:
             # Normalize column names to BigQuery-compatible format
-            normalized_col = (
-                col.replace(" ", "_")
-                .replace(".", "_")
-                .replace("-", "_")
-                .replace("/", "_")
-                .replace("(", "_")
-                .replace(")", "")
-                .replace("?", "")
-                .replace(":", "")
-                .lower()
-            )
+            normalized_col = col.translate(_COLUMN_NAME_TRANSLATION).lower()
 
             # Handle duplicates by appending suffix
-            if normalized_col in normalized:
+            if normalized_col in seen:
                 suffix = 1
-                while f"{normalized_col}_{suffix}" in normalized:
+                while f"{normalized_col}_{suffix}" in seen:
                     suffix += 1
                 normalized_col = f"{normalized_col}_{suffix}"
 
             normalized.append(normalized_col)
+            seen.add(normalized_col)
 
         return normalized
 
@@ -124,8 +137,8 @@ class SchemaInferenceManager:
         if not value:
             return False
 
-        normalized = value.strip().lower()
-        return normalized in {"true", "false", "yes", "no", "1", "0"}
+        # Exact match first: already-clean lowercase values need no stripped/lowered copy
+        return value in _BOOL_VALUES or value.strip().lower() in _BOOL_VALUES
 
     @staticmethod
     def _try_parse_int(value: str) -> bool:
@@ -151,13 +164,25 @@ class SchemaInferenceManager:
         """
         if not value:
             return False
+        return SchemaInferenceManager._is_int64(value.strip())
 
-        try:
-            # Check for leading zeros (except "0" or negative numbers)
-            stripped = value.strip()
-            if len(stripped) > 1 and stripped[0] == "0" and stripped[1].isdigit():
-                return False  # "00123" -> STRING
+    @staticmethod
+    def _is_int64(stripped: str) -> bool:
+        """_try_parse_int for a value that is already stripped."""
+        # Check for leading zeros (except "0" or negative numbers)
+        if len(stripped) > 1 and stripped[0] == "0" and stripped[1].isdigit():
+            return False  # "00123" -> STRING
+
+        # Decide from the characters where possible so non-numeric values don't raise:
+        # int() accepts an optional sign and decimal digits, plus "_" separators between them
+        digits = stripped[1:] if stripped[:1] in ("+", "-") else stripped
+        if not digits.isdecimal():
+            if "_" not in digits:
+                return False
+        elif len(digits) < 19:
+            return True  # Up to 18 digits always fits in INT64
 
+        try:
             parsed = int(stripped)
 
             # Check INT64 range
@@ -202,7 +227,7 @@ class SchemaInferenceManager:
 
         Supported formats:
         - DATE: "YYYY-MM-DD", "YYYY/MM/DD"
-        - TIMESTAMP: "YYYY-MM-DD HH:MM:SS", "YYYY-MM-DD HH:MM:SS.fff"
+        - TIMESTAMP: "YYYY-MM-DD HH:MM:SS", "YYYY-MM-DD HH:MM:SS.fff" (either separator)
 
         Args:
             value: String value to check
@@ -218,44 +243,55 @@ class SchemaInferenceManager:
         """
         if not value:
             return None
+        return SchemaInferenceManager._date_type(value.strip())
 
-        stripped = value.strip()
-
-        # Try timestamp first (more specific)
-        timestamp_patterns = [
-            r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d+)?$",  # YYYY-MM-DD HH:MM:SS.fff
-            r"^\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}(\.\d+)?$",  # YYYY/MM/DD HH:MM:SS.fff
-        ]
-
-        for pattern in timestamp_patterns:
-            if re.match(pattern, stripped):
-                return "TIMESTAMP"
-
-        # Try date patterns
-        date_patterns = [
-            r"^\d{4}-\d{2}-\d{2}$",  # YYYY-MM-DD
-            r"^\d{4}/\d{2}/\d{2}$",  # YYYY/MM/DD
-        ]
-
-        for pattern in date_patterns:
-            if re.match(pattern, stripped):
-                return "DATE"
+    @staticmethod
+    def _date_type(stripped: str) -> Optional[str]:
+        """_try_parse_date for a value that is already stripped."""
+        # Fixed-position checks instead of a regex: the formats are fully positional.
+        # isdecimal() accepts exactly what regex \d does (Unicode decimal digits).
+        length = len(stripped)
+        if length < 10:
+            return None
 
+        separator = stripped[4]
+        if (
+            separator not in "-/"
+            or stripped[7] != separator
+            or not (stripped[:4].isdecimal() and stripped[5:7].isdecimal() and stripped[8:10].isdecimal())
+        ):
+            return None
+        if length == 10:
+            return "DATE"
+
+        if (
+            length >= 19
+            and stripped[10] == " "
+            and stripped[13] == ":"
+            and stripped[16] == ":"
+            and stripped[11:13].isdecimal()
+            and stripped[14:16].isdecimal()
+            and stripped[17:19].isdecimal()
+            and (length == 19 or (length > 20 and stripped[19] == "." and stripped[20:].isdecimal()))
+        ):
+            return "TIMESTAMP"
         return None
 
     @retry_with_backoff(retries=3, exceptions=TRANSIENT_EXCEPTIONS)
     def read_csv_header_and_sample(
-        self, storage_folder_name: str, sample_size: int = 100
+        self, storage_folder_name: str, sample_size: int = 100, sample_bytes: int = DEFAULT_SAMPLE_BYTES
     ) -> Optional[Tuple[List[str], List[List[str]], bool]]:
         """Read CSV header and sample rows from files in GCS folder.
 
         Finds .csv.gz files in the specified folder and extracts the header row
-        plus sample_size data rows. Checks multiple files to detect if title rows
+        plus up to sample_size data rows. Checks multiple files to detect if title rows
         are present, handling mixed-format tables by using the most recent file format.
 
         Args:
             storage_folder_name: GCS folder path (e.g., "caravan-versioned/claim_raw_v1-1")
             sample_size: Number of data rows to sample (default: 100)
+            sample_bytes: Stop sampling once the rows read reach this many UTF-8 bytes (delimiters
+                and newlines included), so files with very wide rows sample fewer of them (default: 1 MiB)
 
         Returns:
             Tuple of (header, sample_rows, has_title_row) or None if no files found
@@ -275,53 +311,47 @@ class SchemaInferenceManager:
             >>> print(has_title)
             True
         """
-        # List blobs in folder
+        # List .csv.gz names in folder. The newest file sorts last, so the whole listing is still
+        # needed, but GCS filters by extension and returns names only, and max() replaces a full sort.
         bucket = self.storage_client.bucket(self.bucket_name)
-        blobs = list(bucket.list_blobs(prefix=storage_folder_name))
+        blobs = bucket.list_blobs(
+            prefix=storage_folder_name, match_glob="**.csv.gz", fields=_NAME_ONLY_FIELDS, page_size=1000
+        )
 
-        # Find all .csv.gz files
-        csv_blobs = [b for b in blobs if b.name.endswith(".csv.gz")]
-        if not csv_blobs:
+        # Check the most recent file (not the oldest) for title row detection
+        # Partition names like report_date=2025-11-30 sort correctly by name
+        target_blob = max((b for b in blobs if b.name.endswith(".csv.gz")), key=lambda b: b.name, default=None)
+        if target_blob is None:
             logger.warning(f"No .csv.gz files found in {storage_folder_name}")
             return None
 
-        # Sort by name (descending) to get most recent files first
-        # Partition names like report_date=2025-11-30 will sort correctly
-        csv_blobs_sorted = sorted(csv_blobs, key=lambda b: b.name, reverse=True)
-
-        # Check the most recent file (not the oldest) for title row detection
-        target_blob = csv_blobs_sorted[0]
         logger.info(f"Reading header and {sample_size} rows from most recent file: {target_blob.name}")
 
         try:
-            # Download blob to memory (not disk)
-            blob_bytes = BytesIO()
-            target_blob.download_to_file(blob_bytes)
-            blob_bytes.seek(0)
-
-            # Decompress gzip and read header + sample rows
-            with gzip.open(blob_bytes, mode="rt", encoding="utf-8") as csv_file:
-                csv_reader = csv.reader(csv_file)
-
-                # Some files contain an invalid row above the header row
-                # it can be identified if it contains only one column
-                header = next(csv_reader)
-                has_title_row = False
-                if len(header) == 1:
-                    has_title_row = True
-                    header = next(csv_reader)
-
-                # Read sample rows
-                sample_rows = []
-                for i, row in enumerate(csv_reader):
-                    if i >= sample_size:
-                        break
-                    sample_rows.append(row)
-
-                logger.info(
-                    f"Sampled {len(sample_rows)} rows with {len(header)} columns (has_title_row={has_title_row})"
-                )
-                return (header, sample_rows, has_title_row)
+            # Fetch only the head of the file: the sample needs a few hundred rows, not the whole object.
+            # A range too short for the sample ends the gzip stream early (EOFError), so retry with a
+            # larger range and finally the full file.
+            for range_bytes in (*_SAMPLE_RANGE_BYTES, None):
+                blob_bytes = BytesIO()
+                if range_bytes is None:
+                    target_blob.download_to_file(blob_bytes)
+                else:
+                    target_blob.download_to_file(blob_bytes, start=0, end=range_bytes - 1)
+                truncated = range_bytes is not None and blob_bytes.tell() >= range_bytes
+                blob_bytes.seek(0)
+
+                try:
+                    header, sample_rows, has_title_row = self._read_header_and_sample(
+                        blob_bytes, sample_size, sample_bytes
+                    )
+                    break
+                except EOFError:
+                    if not truncated:
+                        raise
+                    logger.debug(f"First {range_bytes} bytes of {target_blob.name} too short for sample, fetching more")
+
+            logger.info(f"Sampled {len(sample_rows)} rows with {len(header)} columns (has_title_row={has_title_row})")
+            return (header, sample_rows, has_title_row)
 
         except gzip.BadGzipFile:
             logger.error(f"Failed to decompress {target_blob.name} - not a valid gzip file")
@@ -333,6 +363,40 @@ class SchemaInferenceManager:
             logger.error(f"Error reading CSV header and sample: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _read_header_and_sample(
+        gzipped_csv: BytesIO, sample_size: int, sample_bytes: int
+    ) -> Tuple[List[str], List[List[str]], bool]:
+        """Decompress a gzipped CSV and read its header and first rows.
+
+        Reads sample_size rows, or fewer if they reach sample_bytes bytes of CSV text first.
+
+        Raises:
+            StopIteration: If the file has no header row
+            EOFError: If the data ends before the header and sample rows are read
+        """
+        with gzip.open(gzipped_csv, mode="rt", encoding="utf-8") as csv_file:
+            csv_reader = csv.reader(csv_file)
+
+            # Some files contain an invalid row above the header row
+            # it can be identified if it contains only one column
+            header = next(csv_reader)
+            has_title_row = False
+            if len(header) == 1:
+                has_title_row = True
+                header = next(csv_reader)
+
+            # Read sample rows (at most sample_size, so a partial download needn't cover one more)
+            sample_rows = []
+            remaining_bytes = sample_bytes
+            for row in islice(csv_reader, sample_size):
+                sample_rows.append(row)
+                # Re-encode the row as CSV text: commas and the newline count too (quoting is ignored)
+                remaining_bytes -= len(",".join(row).encode("utf-8")) + 1
+                if remaining_bytes <= 0:
+                    break
+            return (header, sample_rows, has_title_row)
+
     def read_csv_header_from_gcs(self, storage_folder_name: str) -> Optional[List[str]]:
         """Read CSV header row from first file in GCS folder.
 
@@ -350,11 +414,41 @@ class SchemaInferenceManager:
             return header
         return None
 
+    @staticmethod
+    def _classify_value(value: str) -> Optional[str]:
+        """Return the most specific type a stripped, non-empty value parses as.
+
+        Applies the same checks as the _try_parse_* helpers in infer_column_type's
+        detection order, without stripping the value again for each one.
+
+        Returns:
+            "INT64", "BOOL", "BIGNUMERIC", "TIMESTAMP" or "DATE", or None if only STRING fits
+        """
+        # Check INT64 before BOOL so "1" and "0" are recognized as numbers.
+        # int()/float() only accept values starting with a digit, sign, "." or inf/nan, and dates
+        # start with a digit, so the first character rules out failed parses (and their exceptions)
+        # for text columns.
+        first_char = value[0]
+        starts_with_digit = first_char.isdecimal()
+        maybe_number = starts_with_digit or first_char in _NUMERIC_FIRST_CHARS
+        if maybe_number and SchemaInferenceManager._is_int64(value):
+            return "INT64"
+        if value in _BOOL_VALUES or value.lower() in _BOOL_VALUES:
+            return "BOOL"
+        if maybe_number:
+            try:
+                float(value)
+                return "BIGNUMERIC"
+            except (ValueError, OverflowError):
+                pass
+        if starts_with_digit:
+            return SchemaInferenceManager._date_type(value)
+        return None
+
     def infer_column_type(
         self,
         column_name: str,
-        column_index: int,
-        sample_rows: List[List[str]],
+        column_values: Sequence[str],
         confidence_threshold: float = 0.95,
         min_non_null_samples: int = 10,
     ) -> str:
@@ -375,8 +469,7 @@ class SchemaInferenceManager:
 
         Args:
             column_name: Column name (for logging)
-            column_index: Column position in row
-            sample_rows: List of data rows
+            column_values: This column's value in each sample row
             confidence_threshold: Minimum % of values matching type (default: 0.95)
             min_non_null_samples: Minimum non-null values required (default: 10)
 
@@ -384,17 +477,13 @@ class SchemaInferenceManager:
             BigQuery type: "BOOL", "INT64", "BIGNUMERIC", "DATE", "TIMESTAMP", "STRING"
 
         Example:
-            >>> manager.infer_column_type("partner_revenue", 1, sample_rows)
+            >>> manager.infer_column_type("partner_revenue", ["100", "100.50", "7"] * 10)
             'BIGNUMERIC'
         """
         # Extract non-null values for this column
         sample_values = []
-        for row in sample_rows:
-            # Handle rows with fewer columns than expected
-            if column_index >= len(row):
-                continue
-
-            value = row[column_index].strip()
+        for value in column_values:
+            value = value.strip()
             # Skip empty/null values
             if value and value.lower() not in {"null", "none", ""}:
                 sample_values.append(value)
@@ -417,21 +506,11 @@ class SchemaInferenceManager:
             "STRING": len(sample_values),  # Everything can be STRING
         }
 
-        for value in sample_values:
-            # Try types in order (most specific first)
-            # Check INT64 before BOOL so "1" and "0" are recognized as numbers
-            if self._try_parse_int(value):
-                type_counts["INT64"] += 1
-            elif self._try_parse_bool(value):
-                type_counts["BOOL"] += 1
-            elif self._try_parse_numeric(value):
-                type_counts["BIGNUMERIC"] += 1
-            else:
-                date_type = self._try_parse_date(value)
-                if date_type == "TIMESTAMP":
-                    type_counts["TIMESTAMP"] += 1
-                elif date_type == "DATE":
-                    type_counts["DATE"] += 1
+        # Columns repeat values heavily (flags, dates, codes), so classify each distinct value once
+        for value, count in Counter(sample_values).items():
+            value_type = self._classify_value(value)
+            if value_type is not None:
+                type_counts[value_type] += count
 
         # Calculate confidence for each type
         total_samples = len(sample_values)
@@ -497,7 +576,9 @@ class SchemaInferenceManager:
         start_time = time.perf_counter()
 
         # Read CSV header and sample rows for type inference
-        result = self.read_csv_header_and_sample(storage_folder_name, sample_size=self.DEFAULT_SAMPLE_SIZE)
+        result = self.read_csv_header_and_sample(
+            storage_folder_name, sample_size=self.DEFAULT_SAMPLE_SIZE, sample_bytes=self.DEFAULT_SAMPLE_BYTES
+        )
 
         if not result:
             duration = time.perf_counter() - start_time
@@ -528,11 +609,14 @@ class SchemaInferenceManager:
         schema = []
         type_distribution = {"BOOL": 0, "INT64": 0, "BIGNUMERIC": 0, "DATE": 0, "TIMESTAMP": 0, "STRING": 0}
 
+        # Transpose the sample once so each column is inferred from a flat list of its values.
+        # Rows with fewer columns than the header are padded with "", which counts as null.
+        sample_columns = list(zip_longest(*sample_rows, fillvalue=""))
+
         for i, col_name in enumerate(normalized_columns):
             inferred_type = self.infer_column_type(
                 column_name=col_name,
-                column_index=i,
-                sample_rows=sample_rows,
+                column_values=sample_columns[i] if i < len(sample_columns) else (),
                 confidence_threshold=self.DEFAULT_CONFIDENCE_THRESHOLD,
                 min_non_null_samples=self.DEFAULT_MIN_NON_NULL_SAMPLES,
             )
@@ -556,3 +640,29 @@ class SchemaInferenceManager:
         )
 
         return (schema, has_title_row)
+
+    def infer_schemas(
+        self, storage_folder_names: List[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, Optional[Tuple[List[bigquery.SchemaField], bool]]]:
+        """Infer schemas for several GCS folders concurrently.
+
+        Each inference is dominated by GCS list/download latency, so folders are
+        processed on a thread pool rather than one after another.
+
+        Args:
+            storage_folder_names: GCS folder paths
+            max_workers: Maximum folders inferred at once (default: 16)
+
+        Returns:
+            Mapping of folder to infer_schema result (None where inference failed)
+
+        Example:
+            >>> results = manager.infer_schemas(["caravan-versioned/claim_raw_v1-1", "caravan-versioned/asset_raw"])
+            >>> schema, has_title = results["caravan-versioned/claim_raw_v1-1"]
+        """
+        folders = list(dict.fromkeys(storage_folder_names))
+        if not folders:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(folders))) as executor:
+            return dict(zip(folders, executor.map(self.infer_schema, folders)))
@@ -1,3 +1,4 @@
+from itertools import chain, islice
 from typing import List
 
 import click
@@ -7,9 +8,11 @@ from datawagon.commands.files_in_storage import files_in_storage
 from datawagon.console import error, file_list, newline, table, warning
 from datawagon.objects.current_table_data import CurrentDestinationData
 from datawagon.objects.file_comparator import FileComparator
-from datawagon.objects.managed_file_metadata import ManagedFileMetadata
 from datawagon.objects.managed_file_scanner import ManagedFilesToDatabase
 
+# Number of new file names listed before the "...and N more" line
+_MAX_NEW_FILES_DISPLAYED = 10
+
 
 @click.command()
 @click.pass_context
@@ -19,16 +22,17 @@ def compare_local_files_to_bucket(ctx: click.Context) -> List[ManagedFilesToData
     matched_files: List[ManagedFilesToDatabase] = ctx.invoke(files_in_local_fs, file_extension="gz")
     current_bucket_files: List[CurrentDestinationData] = ctx.invoke(files_in_storage)
 
-    csv_file_infos: List[ManagedFileMetadata] = [file_info for src in matched_files for file_info in src.files]
+    # compare_files only counts the files, so iterate the groups in place rather than flattening them
+    csv_file_infos = chain.from_iterable(src.files for src in matched_files)
 
     # Use FileComparator class for comparison logic
     comparator = FileComparator()
-    file_diff_display_df = comparator.compare_files(csv_file_infos, current_bucket_files)
+    file_diff_rows = comparator.compare_files(csv_file_infos, current_bucket_files)
 
     newline()
-    if len(file_diff_display_df) > 0:
+    if len(file_diff_rows) > 0:
         table(
-            data=file_diff_display_df.values.tolist(),
+            data=file_diff_rows,
             headers=["Selector", "Bucket File Count", "Local File Count"],
             title="File Comparison",
         )
@@ -38,9 +42,7 @@ def compare_local_files_to_bucket(ctx: click.Context) -> List[ManagedFilesToData
 
     new_files = comparator.find_new_files(matched_files, current_bucket_files)
 
-    new_csv_file_infos: List[ManagedFileMetadata] = [file_info for src in new_files for file_info in src.files]
-
-    new_file_count = len(new_csv_file_infos)
+    new_file_count = sum(len(src.files) for src in new_files)
 
     newline()
     newline()
@@ -48,9 +50,11 @@ def compare_local_files_to_bucket(ctx: click.Context) -> List[ManagedFilesToData
     if new_file_count == 0:
         warning("No new files found.")
     else:
+        # Only the names that are displayed are collected, however many new files there are
+        new_file_names = (file_info.file_name for src in new_files for file_info in src.files)
         file_list(
-            files=[f.file_name for f in new_csv_file_infos],
-            max_display=10,
+            files=list(islice(new_file_names, _MAX_NEW_FILES_DISPLAYED)),
+            max_display=_MAX_NEW_FILES_DISPLAYED,
             title=f"Found {new_file_count} new files:",
             count_total=new_file_count,
         )
@@ -83,7 +83,12 @@ def drop_bigquery_tables(ctx: click.Context, dry_run: bool, table_name: str | No
     # FIX: Lazy initialization with error handling
     bq_manager = ctx.obj.get("BQ_MANAGER")
     if not bq_manager:
-        bq_manager = BigQueryManager(app_config.gcs_project_id, dataset_id, app_config.gcs_bucket)
+        bq_manager = BigQueryManager(
+            app_config.gcs_project_id,
+            dataset_id,
+            app_config.gcs_bucket,
+            connection_id=app_config.bq_connection_id,
+        )
         if bq_manager.has_error:
             error("Failed to connect to BigQuery. Check credentials and project settings.")
             ctx.abort()
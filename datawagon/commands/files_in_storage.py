@@ -14,14 +14,18 @@ from datawagon.objects.source_config import SourceConfig
 def files_in_storage(ctx: click.Context) -> List[CurrentDestinationData]:
     """Display existing tables and number of rows."""
 
-    app_config: AppConfig = ctx.obj["CONFIG"]
-    gcs_manager = GcsManager(app_config.gcs_project_id, app_config.gcs_bucket)
-
-    if gcs_manager.has_error:
-        error("Unable to connect to GCS. Check credentials and try again.")
-        ctx.abort()
-    else:
-        ctx.obj["GCS_MANAGER"] = gcs_manager
+    # Reuse the manager from an earlier command in the chain: no reconnect, and its short-lived
+    # listing cache (invalidated on upload) spares repeated listings of the same folders
+    gcs_manager = ctx.obj.get("GCS_MANAGER")
+    if not gcs_manager:
+        app_config: AppConfig = ctx.obj["CONFIG"]
+        gcs_manager = GcsManager(app_config.gcs_project_id, app_config.gcs_bucket)
+
+        if gcs_manager.has_error:
+            error("Unable to connect to GCS. Check credentials and try again.")
+            ctx.abort()
+        else:
+            ctx.obj["GCS_MANAGER"] = gcs_manager
 
     valid_config: SourceConfig = ctx.obj["FILE_CONFIG"]
 
@@ -41,6 +41,7 @@ def list_bigquery_tables(ctx: click.Context, dataset: str | None) -> List[BigQue
         project_id=app_config.gcs_project_id,
         dataset_id=dataset_id,
         bucket_name=app_config.gcs_bucket,
+        connection_id=app_config.bq_connection_id,
     )
 
     if bq_manager.has_error:
@@ -97,7 +97,12 @@ def recreate_bigquery_tables(
     # Initialize BigQuery manager
     bq_manager = ctx.obj.get("BQ_MANAGER")
     if not bq_manager:
-        bq_manager = BigQueryManager(app_config.gcs_project_id, dataset_id, app_config.gcs_bucket)
+        bq_manager = BigQueryManager(
+            app_config.gcs_project_id,
+            dataset_id,
+            app_config.gcs_bucket,
+            connection_id=app_config.bq_connection_id,
+        )
         if bq_manager.has_error:
             error("Failed to connect to BigQuery. Check credentials.")
             ctx.abort()
@@ -149,10 +149,12 @@ def cli(
     # Extract BigQuery config from TOML if present
     toml_bq_dataset = None
     toml_bq_storage_prefix = "caravan-versioned"
+    toml_bq_connection_id = None
 
     if valid_config.bigquery:
         toml_bq_dataset = valid_config.bigquery.dataset
         toml_bq_storage_prefix = valid_config.bigquery.storage_prefix
+        toml_bq_connection_id = valid_config.bigquery.connection_id
 
     # Merge configuration: CLI/env takes precedence over TOML
     final_bq_dataset = bq_dataset or toml_bq_dataset
@@ -173,6 +175,7 @@ def cli(
         gcs_bucket=gcs_bucket,
         bq_dataset=final_bq_dataset,
         bq_storage_prefix=final_bq_storage_prefix,
+        bq_connection_id=toml_bq_connection_id,
     )
 
     ctx.obj["CONFIG"] = app_config
@@ -5,6 +5,7 @@ GCS credentials needed for CSV file processing and uploads.
 """
 
 from pathlib import Path
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -23,6 +24,7 @@ class AppConfig(BaseModel):
         bq_dataset: BigQuery dataset name for external tables
         bq_storage_prefix: GCS folder prefix for BigQuery table creation
             (default: "caravan-versioned")
+        bq_connection_id: Optional BigLake connection for metadata-cached external tables
 
     Example:
         >>> config = AppConfig(
@@ -40,3 +42,4 @@ class AppConfig(BaseModel):
     gcs_bucket: str
     bq_dataset: str
     bq_storage_prefix: str = "caravan-versioned"
+    bq_connection_id: Optional[str] = None
@@ -5,7 +5,7 @@ metadata, including source URIs, partitioning configuration, and creation info.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -52,6 +52,30 @@ class BigQueryTableInfo(BaseModel):
         return f"{self.project_id}.{self.dataset_id}.{self.table_name}"
 
 
+class ExternalTableSpec(BaseModel):
+    """Arguments for creating one external table in a bulk create request.
+
+    Attributes:
+        table_name: BigQuery table name (e.g., claim_raw_v1_1)
+        storage_folder_name: GCS folder path (e.g., caravan-versioned/claim_raw_v1-1)
+        use_hive_partitioning: Enable Hive partitioning (default: True)
+        schema_fields: Optional explicit schema (bigquery.SchemaField list); inferred when None
+        header_rows: Header rows per file before any title row (default: 1; 0 for headerless files)
+
+    Example:
+        >>> spec = ExternalTableSpec(
+        ...     table_name="claim_raw_v1_1",
+        ...     storage_folder_name="caravan-versioned/claim_raw_v1-1",
+        ... )
+    """
+
+    table_name: str
+    storage_folder_name: str
+    use_hive_partitioning: bool = True
+    schema_fields: Optional[List[Any]] = None
+    header_rows: int = Field(default=1, ge=0)
+
+
 class StorageFolderSummary(BaseModel):
     """Summary of files in a GCS storage folder.
 
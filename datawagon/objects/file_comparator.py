@@ -5,9 +5,9 @@ source directory against files in the GCS bucket to identify new files that
 need to be uploaded.
 """
 
-from typing import List
-
-import pandas as pd
+from collections import Counter
+from operator import attrgetter
+from typing import Any, Iterable, List
 
 from datawagon.objects.current_table_data import CurrentDestinationData
 from datawagon.objects.file_utils import FileUtils
@@ -32,10 +32,10 @@ class FileComparator:
 
     def compare_files(
         self,
-        local_files: List[ManagedFileMetadata],
+        local_files: Iterable[ManagedFileMetadata],
         bucket_files: List[CurrentDestinationData],
-    ) -> pd.DataFrame:
-        """Create DataFrame comparing local files to bucket files.
+    ) -> List[List[Any]]:
+        """Create table rows comparing local files to bucket files.
 
         Compares the count of files in the local source directory against
         the count of files already in the GCS bucket, grouped by base name.
@@ -45,42 +45,28 @@ class FileComparator:
             bucket_files: Files currently in GCS bucket
 
         Returns:
-            DataFrame with columns: Base Name, DB File Count, Source File Count
-            Sorted by Base Name in ascending order
+            Rows of [base name, DB file count, source file count],
+            sorted by base name in ascending order
 
         Example:
             >>> comparator = FileComparator()
             >>> local_files = [...]  # List of ManagedFileMetadata
             >>> bucket_files = [...]  # List of CurrentDestinationData
-            >>> df = comparator.compare_files(local_files, bucket_files)
-            >>> print(df)
-            Base Name         DB File Count  Source File Count
-            claim_raw         10             12
-            revenue_summary   5              5
+            >>> comparator.compare_files(local_files, bucket_files)
+            [['claim_raw', 10, 12], ['revenue_summary', 5, 5]]
         """
-        grouped_files = self.file_utils.group_by_base_name(local_files)
+        # Only the number of files per base name is shown, so count them instead of grouping the files
+        local_file_counts = Counter(file_info.base_name for file_info in local_files)
 
         bucket_file_dict = {table_data.base_name: table_data.file_count for table_data in bucket_files}
 
-        all_base_names = set(grouped_files.keys()).union(bucket_file_dict.keys())
-
-        data_rows = []
-
-        for base_name in all_base_names:
-            source_file_count = len(grouped_files.get(base_name, []))
-            db_file_count = bucket_file_dict.get(base_name, 0)
-
-            data_rows.append(
-                {
-                    "Base Name": base_name,
-                    "DB File Count": db_file_count,
-                    "Source File Count": source_file_count,
-                }
-            )
-
-        display_table_data = pd.DataFrame(data_rows)
+        all_base_names = local_file_counts.keys() | bucket_file_dict.keys()
 
-        return display_table_data.sort_values(by=["Base Name"])
+        # Rows go straight to the console table, so no DataFrame round trip is needed
+        return [
+            [base_name, bucket_file_dict.get(base_name, 0), local_file_counts[base_name]]
+            for base_name in sorted(all_base_names)
+        ]
 
     def find_new_files(
         self,
@@ -109,18 +95,15 @@ class FileComparator:
             >>> new_file_count = sum(len(group.files) for group in new_groups)
             >>> print(f"Found {new_file_count} new files")
         """
-        existing_files: set[str] = set(
-            [
-                source_file
-                for current_database_file in bucket_files
-                for source_file in current_database_file.source_files
-            ]
+        existing_files = frozenset(
+            source_file for current_database_file in bucket_files for source_file in current_database_file.source_files
         )
 
-        for range_index in range(len(all_local_files)):
-            all_local_files[range_index].files = sorted(
-                [file for file in all_local_files[range_index].files if (file.file_name not in existing_files)],
-                key=lambda x: x.base_name,
-            )
+        for file_group in all_local_files:
+            new_files = [file for file in file_group.files if file.file_name not in existing_files]
+            # Sorting is stable, so a group of zero or one file is already in order
+            if len(new_files) > 1:
+                new_files.sort(key=attrgetter("base_name"))
+            file_group.files = new_files
 
         return all_local_files
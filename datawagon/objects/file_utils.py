@@ -9,6 +9,7 @@ import gzip
 import os
 import shutil
 import zipfile
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List
 
@@ -68,14 +69,10 @@ class FileUtils:
             >>> len(dupes)
             2  # Two files with same name
         """
-        file_names = [file_info.file_name for file_info in file_info_list]
+        # Count every name in one pass instead of rescanning the list for each file
+        file_name_counts = Counter(file_info.file_name for file_info in file_info_list)
 
-        duplicate_files = []
-        for file_info in file_info_list:
-            if file_names.count(file_info.file_name) > 1:
-                duplicate_files.append(file_info)
-
-        return duplicate_files
+        return [file_info for file_info in file_info_list if file_name_counts[file_info.file_name] > 1]
 
     def check_for_different_file_versions(
         self, file_info_list: List[ManagedFileMetadata]
@@ -9,7 +9,7 @@ import fnmatch
 import os
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import toml
 from pydantic import BaseModel, Field, ValidationError
@@ -21,6 +21,9 @@ from datawagon.security import SecurityError, validate_path_traversal
 
 logger = get_logger(__name__)
 
+# (directory, file names) for each directory under a walked root, as produced by os.walk
+DirListing = List[Tuple[str, List[str]]]
+
 
 class ManagedFiles(BaseModel):
     """Container for grouped CSV files with selector metadata.
@@ -88,6 +91,7 @@ class ManagedFileScanner:
         glob_pat: str,
         exclude_pattern: str | None,
         file_extension: str | None = None,
+        dir_listing: DirListing | None = None,
     ) -> List[Path]:
         """Scan directory for CSV files matching pattern.
 
@@ -99,11 +103,12 @@ class ManagedFileScanner:
             glob_pat: Pattern to match filenames
             exclude_pattern: Pattern to exclude files (optional)
             file_extension: Specific file extension to filter (optional)
+            dir_listing: Result of walk_dir(source_path) to reuse instead of walking again (optional)
 
         Returns:
             List of Path objects for matched files
         """
-        all_csv_files = self.find_files(source_path, glob_pat, exclude_pattern, file_extension)
+        all_csv_files = self.find_files(source_path, glob_pat, exclude_pattern, file_extension, dir_listing)
 
         file_names = [str(file) for file in all_csv_files]
 
@@ -115,6 +120,7 @@ class ManagedFileScanner:
         match_pattern: str,
         exclude_pattern: str | None,
         file_extension: str | None = None,
+        dir_listing: DirListing | None = None,
     ) -> List[Path]:
         """Find files matching pattern with security validation.
 
@@ -127,6 +133,7 @@ class ManagedFileScanner:
             match_pattern: Glob pattern to match filenames
             exclude_pattern: Glob pattern to exclude files (optional)
             file_extension: Specific file extension to filter (optional)
+            dir_listing: Result of walk_dir(base_path) to reuse instead of walking again (optional)
 
         Returns:
             List of Path objects for matched files
@@ -145,7 +152,10 @@ class ManagedFileScanner:
         # FIX: Only process exclude_pattern if not None
         exclude_pattern_lower = exclude_pattern.lower() if exclude_pattern is not None else None
 
-        for root, dirnames, filenames in os.walk(base_path):
+        if dir_listing is None:
+            dir_listing = self.walk_dir(base_path)
+
+        for root, filenames in dir_listing:
             for filename in filenames:
                 if fnmatch.fnmatch(filename.lower(), match_pattern):
                     # FIX: Check None before pattern matching
@@ -165,6 +175,19 @@ class ManagedFileScanner:
 
         return [Path(match) for match in matches]
 
+    @staticmethod
+    def walk_dir(base_path: Path) -> DirListing:
+        """List the files in every directory under base_path.
+
+        Args:
+            base_path: Root directory to walk
+
+        Returns:
+            (directory, file names) pairs, one per directory in the tree
+        """
+        # os.walk reads entries with os.scandir, so file types come from the listing without a stat per file
+        return [(root, filenames) for root, _dirnames, filenames in os.walk(base_path)]
+
     def _apply_version_based_folder_naming(self, all_files: List[ManagedFilesToDatabase]) -> None:
         """
         Modify storage_folder_name to include version suffix for versioned files.
@@ -273,6 +296,9 @@ class ManagedFileScanner:
 
         valid_config = self.valid_config
 
+        # Walk the source tree once; every enabled source matches against the same listing
+        dir_listing = self.walk_dir(self.csv_source_dir)
+
         for file_id in valid_config.file:
             file_source = valid_config.file[file_id]
             if file_source.is_enabled:
@@ -281,6 +307,7 @@ class ManagedFileScanner:
                     file_source.select_file_name_base,
                     file_source.exclude_file_name_base,
                     file_extension,
+                    dir_listing,
                 )
 
                 table_mapper = ManagedFilesToDatabase(
@@ -22,6 +22,8 @@ class BigQueryConfig(BaseModel):
         dataset: BigQuery dataset name for external tables
         storage_prefix: GCS folder prefix for BigQuery table creation
             (default: "caravan-versioned")
+        connection_id: Optional BigLake connection (e.g., "us.biglake") used to
+            create metadata-cached external tables
 
     Example:
         >>> config = BigQueryConfig(dataset="youtube_analytics")
@@ -31,6 +33,7 @@ class BigQueryConfig(BaseModel):
 
     dataset: str
     storage_prefix: str = "caravan-versioned"
+    connection_id: Optional[str] = None
 
 
 class SourceFromLocalFS(BaseModel):
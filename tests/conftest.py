@@ -10,9 +10,20 @@ from unittest.mock import Mock
 import pytest
 from google.cloud import storage  # type: ignore[attr-defined]
 
+from datawagon.bucket.bigquery_manager import BigQueryManager, clear_client_cache
 from datawagon.objects.source_config import SourceConfig, SourceFromLocalFS
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_clients() -> Generator[None, None, None]:
+    """Ensure each test builds fresh (possibly mocked) cloud clients and schemas."""
+    clear_client_cache()
+    BigQueryManager.clear_schema_cache()
+    yield
+    clear_client_cache()
+    BigQueryManager.clear_schema_cache()
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test files."""
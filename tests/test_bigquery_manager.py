@@ -1,11 +1,14 @@
 """Tests for BigQueryManager."""
 
-from unittest.mock import Mock, patch
+import threading
+import time
+from unittest.mock import ANY, Mock, patch
 
 from google.api_core import exceptions as google_api_exceptions
 from google.cloud import bigquery
 
-from datawagon.bucket.bigquery_manager import BigQueryManager
+from datawagon.bucket.bigquery_manager import BigQueryManager, _partition_columns_for_uri
+from datawagon.objects.bigquery_table_metadata import ExternalTableSpec
 
 
 def test_normalize_table_name_with_version() -> None:
@@ -26,7 +29,7 @@ def test_normalize_table_name_complex_version() -> None:
     assert result == "claim_raw_v2_3_4"
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_init_with_valid_dataset(mock_client_class: Mock) -> None:
     """Test BigQueryManager initializes successfully with valid dataset."""
     # Setup mock
@@ -48,10 +51,10 @@ def test_init_with_valid_dataset(mock_client_class: Mock) -> None:
     assert manager.project_id == "test-project"
     assert manager.dataset_id == "test_dataset"
     assert manager.bucket_name == "test-bucket"
-    mock_client.get_dataset.assert_called_once_with("test-project.test_dataset")
+    mock_client.get_dataset.assert_called_once_with("test-project.test_dataset", retry=ANY, timeout=5.0)
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_init_with_missing_dataset(mock_client_class: Mock) -> None:
     """Test BigQueryManager handles dataset not found error."""
     # Setup mock
@@ -70,7 +73,7 @@ def test_init_with_missing_dataset(mock_client_class: Mock) -> None:
     assert manager.has_error is True
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_init_with_auth_failure(mock_client_class: Mock) -> None:
     """Test BigQueryManager handles authentication failure."""
     # Setup mock
@@ -89,7 +92,7 @@ def test_init_with_auth_failure(mock_client_class: Mock) -> None:
     assert manager.has_error is True
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_list_external_tables_empty(mock_client_class: Mock) -> None:
     """Test listing external tables returns empty list when none exist."""
     # Setup mock
@@ -113,8 +116,8 @@ def test_list_external_tables_empty(mock_client_class: Mock) -> None:
 
 
 @patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
-@patch("datawagon.bucket.bigquery_manager.storage.Client")
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
 def test_create_external_table_with_partitioning(
     mock_bq_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
 ) -> None:
@@ -165,8 +168,8 @@ def test_create_external_table_with_partitioning(
 
 
 @patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
-@patch("datawagon.bucket.bigquery_manager.storage.Client")
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
 def test_create_external_table_already_exists(
     mock_bq_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
 ) -> None:
@@ -203,7 +206,7 @@ def test_create_external_table_already_exists(
     assert success is False
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_table_exists_true(mock_client_class: Mock) -> None:
     """Test table_exists returns True when table exists."""
     # Setup mock
@@ -228,7 +231,7 @@ def test_table_exists_true(mock_client_class: Mock) -> None:
     mock_client.get_table.assert_called_once_with("test-project.test_dataset.claim_raw_v1_1")
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_table_exists_false(mock_client_class: Mock) -> None:
     """Test table_exists returns False when table does not exist."""
     # Setup mock
@@ -251,7 +254,7 @@ def test_table_exists_false(mock_client_class: Mock) -> None:
     assert exists is False
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_delete_table_success(mock_client_class: Mock) -> None:
     """Test successfully deleting a table."""
     # Setup mock
@@ -275,7 +278,7 @@ def test_delete_table_success(mock_client_class: Mock) -> None:
     mock_client.delete_table.assert_called_once_with("test-project.test_dataset.claim_raw_v1_1")
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_delete_table_not_found(mock_client_class: Mock) -> None:
     """Test deleting non-existent table."""
     # Setup mock
@@ -298,7 +301,7 @@ def test_delete_table_not_found(mock_client_class: Mock) -> None:
     assert success is False
 
 
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.bigquery.Client")
 def test_delete_table_permission_denied(mock_client_class: Mock) -> None:
     """Test deleting table without permissions."""
     # Setup mock
@@ -342,8 +345,19 @@ def test_extract_partition_columns_none() -> None:
     assert result == []
 
 
-@patch("datawagon.bucket.bigquery_manager.storage.Client")
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+def test_extract_partition_columns_cached_per_uri() -> None:
+    """Test repeated URIs reuse the cached scan but return independent lists."""
+    uri = "gs://bucket/cached/report_date=*/file.csv.gz"
+    first = BigQueryManager._extract_partition_columns(uri)
+    first.append("mutated")
+    second = BigQueryManager._extract_partition_columns(uri)
+
+    assert second == ["report_date"]
+    assert _partition_columns_for_uri.cache_info().hits >= 1
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
 def test_create_external_table_with_explicit_schema(
     mock_bq_client_class: Mock, mock_storage_client_class: Mock
 ) -> None:
@@ -391,8 +405,8 @@ def test_create_external_table_with_explicit_schema(
 
 
 @patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
-@patch("datawagon.bucket.bigquery_manager.storage.Client")
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
 def test_create_external_table_with_schema_inference(
     mock_bq_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
 ) -> None:
@@ -443,8 +457,8 @@ def test_create_external_table_with_schema_inference(
 
 
 @patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
-@patch("datawagon.bucket.bigquery_manager.storage.Client")
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
 def test_create_external_table_falls_back_to_autodetect(
     mock_bq_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
 ) -> None:
@@ -490,8 +504,8 @@ def test_create_external_table_falls_back_to_autodetect(
 
 
 @patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
-@patch("datawagon.bucket.bigquery_manager.storage.Client")
-@patch("datawagon.bucket.bigquery_manager.bigquery.Client")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
 def test_create_external_table_fails_without_fallback(
     mock_bq_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
 ) -> None:
@@ -526,3 +540,662 @@ def test_create_external_table_fails_without_fallback(
     # Assertions
     assert success is False
     mock_bq_client.create_table.assert_not_called()
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_list_external_tables_fetches_metadata_concurrently(
+    mock_client_class: Mock, mock_storage_client_class: Mock
+) -> None:
+    """Test listing fetches only external tables and skips deleted ones."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    external_table = Mock()
+    external_table.table_id = "claim_raw_v1_1"
+    external_table.created = None
+    external_table.num_rows = None
+    external_table.external_data_configuration.hive_partitioning = Mock()
+    external_table.external_data_configuration.source_uris = ["gs://test-bucket/folder/report_date=*/file.csv.gz"]
+
+    native_table = Mock()
+    native_table.external_data_configuration = None
+
+    tables_by_ref = {"ext": external_table, "native": native_table}
+
+    def get_table(ref: str) -> Mock:
+        if ref not in tables_by_ref:
+            raise google_api_exceptions.NotFound("Deleted")
+        return tables_by_ref[ref]
+
+    mock_client.list_tables.return_value = [
+        Mock(reference="ext", table_type="EXTERNAL"),
+        Mock(reference="native", table_type="TABLE"),
+        Mock(reference="deleted", table_type="EXTERNAL"),
+    ]
+    mock_client.get_table.side_effect = get_table
+
+    # Initialize manager and list tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+        max_workers=4,
+    )
+    tables = manager.list_external_tables()
+
+    # Assertions
+    assert [t.table_name for t in tables] == ["claim_raw_v1_1"]
+    assert tables[0].is_partitioned is True
+    assert tables[0].partition_columns == ["report_date"]
+    assert mock_client.get_table.call_count == 2
+    assert "native" not in [c.args[0] for c in mock_client.get_table.call_args_list]
+    mock_client.list_tables.assert_called_once_with("test-project.test_dataset", page_size=1000)
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_list_external_tables_from_information_schema(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test listing external tables with a single INFORMATION_SCHEMA query."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    def option_row(table_name: str, option_name: str | None, option_value: str | None) -> Mock:
+        return Mock(table_name=table_name, creation_time=None, option_name=option_name, option_value=option_value)
+
+    mock_client.query.return_value.result.return_value = [
+        option_row("asset_raw", "uris", '["gs://test-bucket/caravan/asset_raw/*.csv.gz"]'),
+        option_row("claim_raw_v1_1", "uris", '["gs://test-bucket/caravan/claim_raw_v1-1/report_date=*/f.csv.gz"]'),
+        option_row("claim_raw_v1_1", "hive_partition_uri_prefix", '"gs://test-bucket/caravan/claim_raw_v1-1"'),
+        option_row("no_options", None, None),
+    ]
+
+    # Initialize manager and list tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    tables = manager.list_external_tables(use_information_schema=True)
+
+    # Assertions
+    mock_client.query.assert_called_once()
+    mock_client.get_table.assert_not_called()
+    assert [t.table_name for t in tables] == ["asset_raw", "claim_raw_v1_1", "no_options"]
+    assert tables[0].is_partitioned is False
+    assert tables[0].source_uri_pattern == "gs://test-bucket/caravan/asset_raw/*.csv.gz"
+    assert tables[1].is_partitioned is True
+    assert tables[1].partition_columns == ["report_date"]
+    assert tables[2].source_uri_pattern == ""
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_table_with_metadata_caching(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test tables created with a BigLake connection enable metadata caching."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    # Initialize manager with connection and create table
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+        connection_id="us.biglake",
+    )
+    success = manager.create_external_table(
+        table_name="test_table",
+        storage_folder_name="test-folder",
+        schema=[bigquery.SchemaField("col1", "STRING", mode="NULLABLE")],
+    )
+
+    # Assertions
+    assert success is True
+    table_arg = mock_client.create_table.call_args[0][0]
+    assert table_arg.max_staleness == BigQueryManager.DEFAULT_MAX_STALENESS
+    assert table_arg.external_data_configuration.connection_id == "us.biglake"
+    # The serialized request body is what BigQuery actually receives
+    assert table_arg.to_api_repr()["externalDataConfiguration"]["metadataCacheMode"] == "AUTOMATIC"
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_table_without_connection_skips_caching(
+    mock_client_class: Mock, mock_storage_client_class: Mock
+) -> None:
+    """Test plain external tables are created without metadata caching."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    # Initialize manager without connection and create table
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    success = manager.create_external_table(
+        table_name="test_table",
+        storage_folder_name="test-folder",
+        schema=[bigquery.SchemaField("col1", "STRING", mode="NULLABLE")],
+    )
+
+    # Assertions
+    assert success is True
+    table_arg = mock_client.create_table.call_args[0][0]
+    assert table_arg.max_staleness is None
+    assert "metadataCacheMode" not in table_arg.to_api_repr()["externalDataConfiguration"]
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_managers_share_client_per_project(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test managers for the same project reuse one pooled BigQuery client."""
+    first = BigQueryManager(project_id="test-project", dataset_id="dataset_a", bucket_name="test-bucket")
+    second = BigQueryManager(project_id="test-project", dataset_id="dataset_b", bucket_name="test-bucket")
+
+    # Assertions
+    assert first.bq_client is second.bq_client
+    mock_client_class.assert_called_once_with(project="test-project")
+    first.bq_client._http.mount.assert_called_once()
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_table_exists_is_cached_and_invalidated(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test table_exists caches lookups and tracks deletes and invalidation."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    # Initialize manager and check table existence twice
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    assert manager.table_exists("claim_raw_v1_1") is True
+    assert manager.table_exists("claim_raw_v1_1") is True
+    assert mock_client.get_table.call_count == 1
+
+    # Deleting updates the cache without another lookup
+    assert manager.delete_table("claim_raw_v1_1") is True
+    assert manager.table_exists("claim_raw_v1_1") is False
+    assert mock_client.get_table.call_count == 1
+
+    # Invalidation forces a fresh lookup
+    manager.invalidate_cache("claim_raw_v1_1")
+    assert manager.table_exists("claim_raw_v1_1") is True
+    assert mock_client.get_table.call_count == 2
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_tables_batches_ddl(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test bulk creation issues one DDL script and reports per-table failures."""
+    # Setup mock: second table fails inside the script
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.return_value.result.return_value = [Mock(table_name="claim_raw_v1_1", message="Already exists")]
+
+    schema = [bigquery.SchemaField("asset_id", "STRING", mode="NULLABLE")]
+    specs = [
+        ExternalTableSpec(
+            table_name="claim_raw_v1_0", storage_folder_name="caravan/claim_raw_v1-0", schema_fields=schema
+        ),
+        ExternalTableSpec(
+            table_name="claim_raw_v1_1", storage_folder_name="caravan/claim_raw_v1-1", schema_fields=schema
+        ),
+    ]
+
+    # Initialize manager and create tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    results = manager.create_external_tables(specs)
+
+    # Assertions
+    assert results == [True, False]
+    mock_client.query.assert_called_once()
+    mock_client.create_table.assert_not_called()
+    script = mock_client.query.call_args[0][0]
+    assert script.count("CREATE EXTERNAL TABLE") == 2
+    assert "`test-project.test_dataset.claim_raw_v1_0` (`asset_id` STRING) WITH PARTITION COLUMNS" in script
+    assert 'hive_partition_uri_prefix = "gs://test-bucket/caravan/claim_raw_v1-0"' in script
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_tables_job_failure(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test a failed DDL job marks every table as not created."""
+    # Setup mock: the script job itself is rejected
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.side_effect = google_api_exceptions.PermissionDenied("No access")
+
+    schema = [bigquery.SchemaField("asset_id", "STRING", mode="NULLABLE")]
+    specs = [
+        ExternalTableSpec(
+            table_name="claim_raw_v1_0", storage_folder_name="caravan/claim_raw_v1-0", schema_fields=schema
+        ),
+        ExternalTableSpec(
+            table_name="claim_raw_v1_1", storage_folder_name="caravan/claim_raw_v1-1", schema_fields=schema
+        ),
+    ]
+
+    # Initialize manager and create tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    results = manager.create_external_tables(specs)
+
+    # Assertions
+    assert results == [False, False]
+
+
+@patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_tables_respects_autodetect_fallback(
+    mock_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
+) -> None:
+    """Test a batch skips tables whose schema can't be inferred when autodetect fallback is off."""
+    # Setup mocks: inference fails for the folder without an explicit schema
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.return_value.result.return_value = []
+    mock_schema_manager_class.return_value.infer_schema.return_value = None
+
+    schema = [bigquery.SchemaField("asset_id", "STRING", mode="NULLABLE")]
+    specs = [
+        ExternalTableSpec(
+            table_name="claim_raw_v1_0", storage_folder_name="caravan/claim_raw_v1-0", schema_fields=schema
+        ),
+        ExternalTableSpec(table_name="claim_raw_v1_1", storage_folder_name="caravan/claim_raw_v1-1"),
+    ]
+
+    # Initialize manager and create tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    results = manager.create_external_tables(specs, use_autodetect_fallback=False)
+
+    # Assertions
+    assert results == [True, False]
+    script = mock_client.query.call_args[0][0]
+    assert script.count("CREATE EXTERNAL TABLE") == 1
+    assert "claim_raw_v1_1`" not in script
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_tables_falls_back_when_script_too_long(
+    mock_client_class: Mock, mock_storage_client_class: Mock
+) -> None:
+    """Test bulk creation creates one table at a time when the script is too long."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    schema = [bigquery.SchemaField("asset_id", "STRING", mode="NULLABLE")]
+    specs = [
+        ExternalTableSpec(table_name=name, storage_folder_name=f"caravan/{name}", schema_fields=schema)
+        for name in ["claim_raw_v1_0", "claim_raw_v1_1", "bad-name"]
+    ]
+
+    # Initialize manager and create tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    with patch.object(BigQueryManager, "MAX_QUERY_LENGTH", 100):
+        results = manager.create_external_tables(specs)
+
+    # Assertions
+    assert results == [True, True, False]
+    mock_client.query.assert_not_called()
+    assert mock_client.create_table.call_count == 2
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_init_times_out_on_stalled_dataset_check(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test the dataset check bounds its request and retries, and a timeout sets has_error."""
+    # Setup mock: the retry deadline passes without a successful response
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.get_dataset.side_effect = google_api_exceptions.RetryError("Deadline exceeded", cause=None)
+
+    # Initialize manager
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+        dataset_probe_timeout=0.05,
+    )
+
+    # Assertions
+    assert manager.has_error is True
+    call = mock_client.get_dataset.call_args
+    assert call.kwargs["timeout"] == 0.05
+    assert call.kwargs["retry"].deadline == 0.05
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_bulk_init_preserves_config_order(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test bulk_init builds one manager per config, in order."""
+    managers = BigQueryManager.bulk_init(
+        [
+            ("test-project", "dataset_a", "bucket-a"),
+            ("test-project", "dataset_b", "bucket-b"),
+            ("other-project", "dataset_c", "bucket-c"),
+        ]
+    )
+
+    # Assertions
+    assert [m.dataset_id for m in managers] == ["dataset_a", "dataset_b", "dataset_c"]
+    assert [m.bucket_name for m in managers] == ["bucket-a", "bucket-b", "bucket-c"]
+    assert all(m.has_error is False for m in managers)
+    assert mock_client_class.call_count == 2
+    assert BigQueryManager.bulk_init([]) == []
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_iter_external_tables_stops_early(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test iter_external_tables yields tables without waiting for the whole dataset."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    def get_table(ref: str) -> Mock:
+        if ref != "t0":
+            time.sleep(0.01)
+        table = Mock()
+        table.table_id = ref
+        table.created = None
+        table.num_rows = None
+        table.external_data_configuration.hive_partitioning = None
+        table.external_data_configuration.source_uris = [f"gs://test-bucket/{ref}/*.csv.gz"]
+        return table
+
+    mock_client.list_tables.return_value = [Mock(reference=f"t{i}", table_type="EXTERNAL") for i in range(50)]
+    mock_client.get_table.side_effect = get_table
+
+    # Initialize manager and take the first table
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+        max_workers=1,
+    )
+    tables = manager.iter_external_tables()
+    first = next(tables)
+    tables.close()
+
+    # Assertions
+    assert first.table_name == "t0"
+    assert mock_client.get_table.call_count < 10
+    assert [t.table_name for t in manager.list_external_tables()] == sorted(f"t{i}" for i in range(50))
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_delete_tables_batches_drops(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test bulk deletion issues one DROP script and reports per-table failures."""
+    # Setup mock: second table is already gone
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.return_value.result.return_value = [Mock(table_name="claim_raw_v1_1", message="Not found")]
+
+    # Initialize manager and delete tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    results = manager.delete_tables(["claim_raw_v1_0", "claim_raw_v1_1"])
+
+    # Assertions
+    assert results == {"claim_raw_v1_0": True, "claim_raw_v1_1": False}
+    mock_client.delete_table.assert_not_called()
+    script = mock_client.query.call_args[0][0]
+    assert "DROP EXTERNAL TABLE `test-project.test_dataset.claim_raw_v1_0`;" in script
+    assert manager.table_exists("claim_raw_v1_0") is False
+    mock_client.get_table.assert_not_called()
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_delete_tables_job_failure(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test a failed DROP job marks every table as not deleted."""
+    # Setup mock: the script job itself is rejected
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.side_effect = google_api_exceptions.PermissionDenied("No access")
+
+    # Initialize manager and delete tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    results = manager.delete_tables(["claim_raw_v1_0", "claim_raw_v1_1"])
+
+    # Assertions
+    assert results == {"claim_raw_v1_0": False, "claim_raw_v1_1": False}
+    mock_client.delete_table.assert_not_called()
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_delete_tables_falls_back_when_script_too_long(
+    mock_client_class: Mock, mock_storage_client_class: Mock
+) -> None:
+    """Test bulk deletion deletes one table at a time when the script is too long."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    # Initialize manager and delete tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    with patch.object(BigQueryManager, "MAX_QUERY_LENGTH", 100):
+        results = manager.delete_tables(["claim_raw_v1_0", "claim_raw_v1_1"])
+
+    # Assertions
+    assert results == {"claim_raw_v1_0": True, "claim_raw_v1_1": True}
+    mock_client.query.assert_not_called()
+    assert mock_client.delete_table.call_count == 2
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_invalid_table_names_rejected_without_api_calls(
+    mock_client_class: Mock, mock_storage_client_class: Mock
+) -> None:
+    """Test invalid table names are rejected locally before any BigQuery request."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.return_value.result.return_value = []
+    bad_name = "claim_raw`; DROP SCHEMA x; --"
+
+    # Initialize manager
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+
+    # Assertions
+    assert manager.table_exists("claim-raw v1") is False
+    assert manager.delete_table(bad_name) is False
+    assert manager.create_external_table("", "caravan/claim_raw_v1-0", schema=[Mock()]) is False
+    assert manager.delete_tables(["claim_raw_v1_0", bad_name, "claim_raw_v1_1"]) == {
+        "claim_raw_v1_0": True,
+        bad_name: False,
+        "claim_raw_v1_1": True,
+    }
+    mock_client.get_table.assert_not_called()
+    mock_client.delete_table.assert_not_called()
+    mock_client.create_table.assert_not_called()
+    assert bad_name not in mock_client.query.call_args[0][0]
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_create_external_table_async_overlaps_creates(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test async creation returns futures that resolve to per-table results."""
+    # Setup mock: both creates must be in flight at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    def create_table(table: bigquery.Table) -> bigquery.Table:
+        barrier.wait()
+        return table
+
+    mock_client.create_table.side_effect = create_table
+
+    # Initialize manager and create tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    schema = [bigquery.SchemaField("asset_id", "STRING", mode="NULLABLE")]
+    futures = [
+        manager.create_external_table_async("claim_raw_v1_0", "caravan/claim_raw_v1-0", schema=schema),
+        manager.create_external_table_async("claim_raw_v1_1", "caravan/claim_raw_v1-1", schema=schema),
+    ]
+
+    # Assertions
+    assert [future.result(timeout=10) for future in futures] == [True, True]
+    assert mock_client.create_table.call_count == 2
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_delete_table_retries_transient_then_maps_errors(
+    mock_client_class: Mock, mock_storage_client_class: Mock, mock_sleep: Mock
+) -> None:
+    """Test transient errors reach the retry and API errors map to False."""
+    # Setup mock: first call is transient, second succeeds, third is rejected
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.delete_table.side_effect = [
+        google_api_exceptions.ServiceUnavailable("Try again"),
+        None,
+        google_api_exceptions.BadRequest("Rejected"),
+    ]
+
+    # Initialize manager and delete tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+
+    # Assertions
+    assert manager.delete_table("claim_raw_v1_0") is True
+    assert mock_sleep.call_count == 1
+    assert manager.delete_table("claim_raw_v1_1") is False
+    assert mock_client.delete_table.call_count == 3
+
+
+@patch("datawagon.bucket.schema_inference.SchemaInferenceManager")
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_inferred_schema_is_memoized_per_folder(
+    mock_bq_client_class: Mock, mock_storage_client_class: Mock, mock_schema_manager_class: Mock
+) -> None:
+    """Test tables over the same folder reuse one schema inference until cleared."""
+    # Setup mocks: first inference fails, later ones succeed
+    inferred_schema = [bigquery.SchemaField("column_a", "STRING", mode="NULLABLE")]
+    mock_schema_manager = Mock()
+    mock_schema_manager.infer_schema.side_effect = [None, (inferred_schema, True), (inferred_schema, True)]
+    mock_schema_manager_class.return_value = mock_schema_manager
+
+    # Initialize manager and create tables over one folder
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    for table_name in ["table_a", "table_b", "table_c"]:
+        manager.create_external_table(table_name=table_name, storage_folder_name="test-folder")
+
+    # Assertions: the failed attempt is not cached, the success is
+    assert mock_schema_manager.infer_schema.call_count == 2
+    table_arg = mock_bq_client_class.return_value.create_table.call_args[0][0]
+    assert table_arg.external_data_configuration.schema == inferred_schema
+    assert table_arg.external_data_configuration.csv_options.skip_leading_rows == 2
+
+    BigQueryManager.clear_schema_cache()
+    manager.create_external_table(table_name="table_d", storage_folder_name="test-folder")
+    assert mock_schema_manager.infer_schema.call_count == 3
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_headerless_files_skip_no_rows(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test header_rows=0 sets skip_leading_rows=0 in both API and DDL creation."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.query.return_value.result.return_value = []
+    schema = [bigquery.SchemaField("asset_id", "STRING", mode="NULLABLE")]
+
+    # Initialize manager and create tables
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    manager.create_external_table("claim_raw_v1_0", "caravan/claim_raw_v1-0", schema=schema, header_rows=0)
+    manager.create_external_tables(
+        [
+            ExternalTableSpec(
+                table_name=name, storage_folder_name=f"caravan/{name}", schema_fields=schema, header_rows=0
+            )
+            for name in ["claim_raw_v1_1", "claim_raw_v1_2"]
+        ]
+    )
+
+    # Assertions
+    table_arg = mock_client.create_table.call_args[0][0]
+    assert table_arg.external_data_configuration.csv_options.skip_leading_rows == 0
+    assert mock_client.query.call_args[0][0].count("skip_leading_rows = 0") == 2
+
+
+@patch("google.cloud.storage.Client")
+@patch("google.cloud.bigquery.Client")
+def test_storage_client_created_only_when_needed(mock_client_class: Mock, mock_storage_client_class: Mock) -> None:
+    """Test the GCS client is built on first use, not in the constructor."""
+    manager = BigQueryManager(
+        project_id="test-project",
+        dataset_id="test_dataset",
+        bucket_name="test-bucket",
+    )
+    manager.table_exists("claim_raw_v1_0")
+
+    # Assertions
+    mock_storage_client_class.assert_not_called()
+    assert manager.storage_client is manager.storage_client
+    mock_storage_client_class.assert_called_once_with(project="test-project")
@@ -36,9 +36,9 @@ class TestCompareFiles:
         result = comparator.compare_files(local_files, bucket_files)
 
         assert len(result) == 1
-        assert result.iloc[0]["Base Name"] == "claim_raw"
-        assert result.iloc[0]["DB File Count"] == 5
-        assert result.iloc[0]["Source File Count"] == 0
+        assert result[0][0] == "claim_raw"
+        assert result[0][1] == 5
+        assert result[0][2] == 0
 
     def test_compare_files_empty_bucket_files(self, tmp_path: Path) -> None:
         """Test compare_files with empty bucket files list."""
@@ -69,9 +69,9 @@ class TestCompareFiles:
         result = comparator.compare_files(local_files, bucket_files)
 
         assert len(result) == 1
-        assert result.iloc[0]["Base Name"] == "claim_raw"
-        assert result.iloc[0]["DB File Count"] == 0
-        assert result.iloc[0]["Source File Count"] == 1
+        assert result[0][0] == "claim_raw"
+        assert result[0][1] == 0
+        assert result[0][2] == 1
 
     def test_compare_files_matching_files(self, tmp_path: Path) -> None:
         """Test compare_files with matching files in both locations."""
@@ -102,9 +102,9 @@ class TestCompareFiles:
         result = comparator.compare_files(local_files, bucket_files)
 
         assert len(result) == 1
-        assert result.iloc[0]["Base Name"] == "claim_raw"
-        assert result.iloc[0]["DB File Count"] == 3
-        assert result.iloc[0]["Source File Count"] == 1
+        assert result[0][0] == "claim_raw"
+        assert result[0][1] == 3
+        assert result[0][2] == 1
 
     def test_compare_files_multiple_base_names(self, tmp_path: Path) -> None:
         """Test compare_files with multiple base names."""
@@ -156,11 +156,11 @@ class TestCompareFiles:
 
         assert len(result) == 2
         # Results should be sorted by Base Name
-        assert result.iloc[0]["Base Name"] == "claim_raw"
-        assert result.iloc[1]["Base Name"] == "revenue_summary"
+        assert result[0][0] == "claim_raw"
+        assert result[1][0] == "revenue_summary"
 
     def test_compare_files_sorted_by_base_name(self, tmp_path: Path) -> None:
-        """Test that compare_files returns DataFrame sorted by Base Name."""
+        """Test that compare_files returns rows sorted by base name."""
         comparator = FileComparator()
 
         # Create files with base names in non-alphabetical order
@@ -205,8 +205,8 @@ class TestCompareFiles:
         result = comparator.compare_files(local_files, bucket_files)
 
         # Should be sorted alphabetically
-        assert result.iloc[0]["Base Name"] == "apple_data"
-        assert result.iloc[1]["Base Name"] == "zebra_data"
+        assert result[0][0] == "apple_data"
+        assert result[1][0] == "zebra_data"
 
 
 @pytest.mark.unit
@@ -0,0 +1,380 @@
+"""Tests for GcsManager."""
+
+import threading
+from pathlib import Path
+from typing import Any, Iterator, List
+from unittest.mock import Mock, create_autospec, patch
+
+import pytest
+from google.api_core import exceptions as google_api_exceptions
+from google.cloud import storage  # type: ignore[attr-defined]
+
+from datawagon.bucket.gcs_manager import GcsManager, _validated_blob_name
+from datawagon.objects.source_config import SourceConfig, SourceFromLocalFS
+from datawagon.security import SecurityError
+
+
+def _source(base: str, folder: str, is_enabled: bool = True) -> SourceFromLocalFS:
+    return SourceFromLocalFS(
+        is_enabled=is_enabled,
+        select_file_name_base=base,
+        exclude_file_name_base=".~lock*",
+        regex_pattern=None,
+        regex_group_names=None,
+        storage_folder_name=folder,
+        table_name=folder,
+        table_append_or_replace="append",
+    )
+
+
+def _blob(name: str) -> Mock:
+    blob = Mock()
+    blob.name = name
+    return blob
+
+
+@patch("google.cloud.storage.Client")
+def test_files_in_blobs_df_lists_sources_concurrently(mock_client_class: Mock) -> None:
+    """Test every enabled source is listed and combined in config order."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    blobs_by_glob = {
+        "**claim_raw*/**Claim_***.csv.gz": ["caravan/claim_raw/report_date=2023-06-30/Claim_a.csv.gz"],
+        "**asset_raw*/**Asset_***.csv.gz": [
+            "caravan/asset_raw/report_date=2023-06-30/Asset_a.csv.gz",
+            "caravan/asset_raw/report_date=2023-07-31/Asset_b.csv.gz",
+        ],
+    }
+    mock_client.list_blobs.side_effect = lambda bucket, prefix, match_glob, page_size, fields: [
+        _blob(name) for name in blobs_by_glob[match_glob]
+    ]
+    config = SourceConfig(
+        file={
+            "claim": _source("Claim_*", "caravan/claim_raw"),
+            "disabled": _source("Other_*", "caravan/other", is_enabled=False),
+            "asset": _source("Asset_*", "caravan/asset_raw"),
+        }
+    )
+
+    # Initialize manager and list files
+    manager = GcsManager("test-project", "test-bucket", max_workers=2)
+    df = manager.files_in_blobs_df(config)
+
+    # Assertions
+    assert df["_file_name"].tolist() == ["Claim_a.csv.gz", "Asset_a.csv.gz", "Asset_b.csv.gz"]
+    assert df["base_name"].tolist() == ["Claim_*", "Asset_*", "Asset_*"]
+    assert df["base_name"].dtype == "category"
+    assert mock_client.list_blobs.call_count == 2
+
+
+@patch("google.cloud.storage.Client")
+def test_init_mounts_pooled_transport(mock_client_class: Mock) -> None:
+    """Test the storage client gets a larger keep-alive connection pool."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+
+    # Initialize manager
+    GcsManager("test-project", "test-bucket")
+
+    # Assertions
+    prefix, adapter = mock_client._http.mount.call_args[0]
+    assert prefix == "https://"
+    assert adapter._pool_maxsize >= GcsManager.DEFAULT_MAX_WORKERS
+
+
+@patch("google.cloud.storage.Client")
+def test_iter_blob_names_streams_and_list_blobs_wraps_it(mock_client_class: Mock) -> None:
+    """Test blob names are yielded lazily and list_blobs returns the same names."""
+    # Setup mock: record how far the listing has been consumed
+    consumed = []
+
+    def list_blobs(bucket: str, **kwargs: Any) -> Iterator[Mock]:
+        for name in ["caravan/claim_raw/a.csv.gz", "caravan/claim_raw/b.csv.gz"]:
+            consumed.append(name)
+            yield _blob(name)
+
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.list_blobs.side_effect = list_blobs
+
+    # Initialize manager and list blobs
+    manager = GcsManager("test-project", "test-bucket")
+    names = manager.iter_blob_names("caravan/claim_raw", "YouTube_*", ".csv.gz")
+
+    # Assertions
+    assert next(names) == "caravan/claim_raw/a.csv.gz"
+    assert consumed == ["caravan/claim_raw/a.csv.gz"]
+    assert manager.list_blobs("caravan/claim_raw", "YouTube_*", ".csv.gz") == [
+        "caravan/claim_raw/a.csv.gz",
+        "caravan/claim_raw/b.csv.gz",
+    ]
+    mock_client.list_blobs.assert_called_with(
+        "test-bucket",
+        prefix="caravan/claim_raw",
+        match_glob="**claim_raw*/**YouTube_***.csv.gz",
+        page_size=1000,
+        fields="items(name),nextPageToken",
+    )
+    # Wildcard folders can't narrow the prefix
+    assert GcsManager._glob_query("YouTube_*", "YouTube_*", ".csv.gz")[0] == ""
+
+
+@patch("google.cloud.storage.Client")
+def test_list_all_blobs_with_prefix_requests_names_only(mock_client_class: Mock) -> None:
+    """Test prefix listing asks GCS for names only."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.list_blobs.return_value = [_blob("caravan/a.csv.gz")]
+
+    # Initialize manager and list blobs
+    manager = GcsManager("test-project", "test-bucket")
+
+    # Assertions
+    assert manager.list_all_blobs_with_prefix("caravan") == ["caravan/a.csv.gz"]
+    mock_client.list_blobs.assert_called_once_with(
+        "test-bucket",
+        prefix="caravan",
+        start_offset=None,
+        end_offset=None,
+        page_size=1000,
+        fields="items(name),nextPageToken",
+    )
+
+
+@patch("google.cloud.storage.Client")
+def test_files_in_blobs_df_without_matches(mock_client_class: Mock) -> None:
+    """Test sources with no blobs still produce the expected empty columns."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.list_blobs.return_value = []
+    config = SourceConfig(file={"claim": _source("Claim_*", "caravan/claim_raw")})
+
+    # Initialize manager and list files
+    manager = GcsManager("test-project", "test-bucket")
+    df = manager.files_in_blobs_df(config)
+
+    # Assertions
+    assert list(df.columns) == ["_file_name", "base_name"]
+    assert df.empty
+
+
+@patch("google.cloud.storage.Client")
+def test_listings_are_cached_until_invalidated(mock_client_class: Mock) -> None:
+    """Test repeated listings reuse one request until an overlapping prefix changes."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.list_blobs.side_effect = lambda *args, **kwargs: [_blob("caravan/claim_raw/a.csv.gz")]
+
+    # Initialize manager and list twice
+    manager = GcsManager("test-project", "test-bucket")
+    first = manager.list_blobs("caravan/claim_raw", "YouTube_*", ".csv.gz")
+    first.append("mutated")
+    second = manager.list_blobs("caravan/claim_raw", "YouTube_*", ".csv.gz")
+    manager.list_all_blobs_with_prefix("caravan")
+    manager.list_all_blobs_with_prefix("caravan")
+
+    # Assertions
+    assert second == ["caravan/claim_raw/a.csv.gz"]
+    assert mock_client.list_blobs.call_count == 2
+
+    manager.invalidate_list_cache("other/file.csv.gz")
+    manager.list_blobs("caravan/claim_raw", "YouTube_*", ".csv.gz")
+    assert mock_client.list_blobs.call_count == 2
+
+    manager.invalidate_list_cache("caravan/claim_raw/report_date=2023-06-30/b.csv.gz")
+    manager.list_blobs("caravan/claim_raw", "YouTube_*", ".csv.gz")
+    manager.list_all_blobs_with_prefix("caravan")
+    assert mock_client.list_blobs.call_count == 4
+
+
+@patch("google.cloud.storage.Client")
+def test_upload_many_runs_uploads_concurrently_in_order(mock_client_class: Mock) -> None:
+    """Test upload_many overlaps uploads and reports results in input order."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    barrier = threading.Barrier(2, timeout=5)
+
+    def upload_blob(source: str, destination: str, overwrite: bool = False) -> bool:
+        if destination == "bad":
+            raise ValueError("Invalid destination blob name")
+        barrier.wait()  # both valid uploads must be in flight together
+        return destination.endswith(".csv.gz")
+
+    # Initialize manager and upload
+    manager = GcsManager("test-project", "test-bucket")
+    with patch.object(manager, "upload_blob", side_effect=upload_blob):
+        results = manager.upload_many(
+            [("/data/a.csv.gz", "youtube/a.csv.gz"), ("/data/bad", "bad"), ("/data/b.csv", "youtube/b.csv")],
+            max_concurrency=3,
+        )
+
+    # Assertions
+    assert results == [True, False, False]
+    assert manager.upload_many([]) == []
+    # A missing local file fails its own pair only
+    assert manager.upload_many([("/nonexistent/a.csv.gz", "youtube/a.csv.gz")]) == [False]
+
+
+@patch("google.cloud.storage.Client")
+def test_upload_blob_chunks_only_large_files(mock_client_class: Mock, tmp_path: Path) -> None:
+    """Test large files use chunked resumable uploads and small files a single request."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    bucket = mock_client.bucket.return_value
+    bucket.blob.return_value.size = 4
+    source = tmp_path / "a.csv.gz"
+    source.write_bytes(b"data")
+
+    # Initialize manager and upload
+    manager = GcsManager("test-project", "test-bucket")
+    assert manager.upload_blob(str(source), "youtube/a.csv.gz") is True
+    small_call = bucket.blob.call_args
+    with patch("datawagon.bucket.gcs_manager._RESUMABLE_UPLOAD_THRESHOLD", 1):
+        assert manager.upload_blob(str(source), "youtube/b.csv.gz") is True
+
+    # Assertions
+    assert small_call.kwargs["chunk_size"] is None
+    assert bucket.blob.call_args.kwargs["chunk_size"] == 32 * 1024 * 1024
+    bucket.blob.return_value.upload_from_filename.assert_called_with(str(source), if_generation_match=0)
+    bucket.blob.return_value.reload.assert_not_called()
+
+
+@patch("google.cloud.storage.Client")
+def test_copy_blob_verifies_without_serial_reloads(mock_client_class: Mock) -> None:
+    """Test copies trust the copy response and only fetch source metadata when no size is given."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    bucket = mock_client.bucket.return_value
+    # Autospec so calls must match the real Blob.reload signature
+    source_blob = create_autospec(storage.Blob, instance=True)
+    source_blob.size = 10
+    bucket.blob.return_value = source_blob
+    bucket.copy_blob.return_value.size = 10
+
+    # Initialize manager and copy
+    manager = GcsManager("test-project", "test-bucket")
+    assert manager.copy_blob_within_bucket("a/x.csv.gz", "b/x.csv.gz") is True
+    assert manager.copy_blob_within_bucket("a/x.csv.gz", "b/y.csv.gz", source_size=10) is True
+    assert manager.copy_blob_within_bucket("a/x.csv.gz", "b/z.csv.gz", source_size=11) is False
+
+    # Assertions
+    source_blob.reload.assert_called_once_with()
+    bucket.copy_blob.return_value.reload.assert_not_called()
+    assert bucket.copy_blob.call_count == 3
+    mock_client.bucket.assert_called_once_with("test-bucket")
+
+
+def test_validated_blob_name_caches_only_valid_names() -> None:
+    """Test valid names are memoized and invalid names keep raising."""
+    _validated_blob_name.cache_clear()
+
+    assert _validated_blob_name("youtube/a.csv.gz") == "youtube/a.csv.gz"
+    assert _validated_blob_name("youtube/a.csv.gz") == "youtube/a.csv.gz"
+    for _ in range(2):
+        with pytest.raises(SecurityError):
+            _validated_blob_name("../escape.csv.gz")
+
+    # Assertions
+    info = _validated_blob_name.cache_info()
+    assert (info.hits, info.currsize) == (1, 1)
+
+
+@patch("google.cloud.storage.Client")
+def test_init_checks_access_with_single_bucket_get(mock_client_class: Mock) -> None:
+    """Test construction probes only the target bucket, tolerates a missing one, and flags auth failures."""
+    # Setup mock: bucket GETs succeed, then 404, then 401
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    bucket_reload = mock_client.bucket.return_value.reload
+    bucket_reload.side_effect = [
+        None,
+        google_api_exceptions.NotFound("no bucket"),
+        google_api_exceptions.Unauthenticated("no creds"),
+    ]
+
+    # Initialize managers
+    manager = GcsManager("test-project", "test-bucket")
+    missing = GcsManager("test-project", "test-bucket")
+    failed = GcsManager("test-project", "test-bucket")
+
+    # Assertions
+    assert manager.has_error is False
+    assert missing.has_error is False
+    assert failed.has_error is True
+    assert bucket_reload.call_count == 3
+    mock_client.bucket.assert_called_with("test-bucket")
+
+
+@patch("google.cloud.storage.Client")
+def test_files_in_blobs_df_lists_shared_queries_once(mock_client_class: Mock) -> None:
+    """Test sources with the same folder and pattern share a single listing."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.list_blobs.side_effect = lambda *args, **kwargs: [_blob("caravan/claim_raw/Claim_a.csv.gz")]
+    config = SourceConfig(
+        file={
+            "claim": _source("Claim_*", "caravan/claim_raw"),
+            "claim_copy": _source("Claim_*", "caravan/claim_raw"),
+        }
+    )
+
+    # Initialize manager and list files
+    manager = GcsManager("test-project", "test-bucket")
+    df = manager.files_in_blobs_df(config)
+
+    # Assertions
+    assert df["_file_name"].tolist() == ["Claim_a.csv.gz", "Claim_a.csv.gz"]
+    mock_client.list_blobs.assert_called_once()
+
+
+@patch("google.cloud.storage.Client")
+def test_list_all_blobs_with_prefix_shards_name_ranges(mock_client_class: Mock) -> None:
+    """Test sharded prefix listings cover disjoint ranges and keep sorted order."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    names = ["p/0.csv.gz", "p/Z.csv.gz", "p/_x.csv.gz", "p/m.csv.gz", "p/z.csv.gz"]
+
+    def list_blobs(bucket: str, prefix: str, start_offset: Any, end_offset: Any, **kwargs: Any) -> List[Mock]:
+        return [
+            _blob(name)
+            for name in names
+            if (start_offset is None or name >= start_offset) and (end_offset is None or name < end_offset)
+        ]
+
+    mock_client.list_blobs.side_effect = list_blobs
+
+    # Initialize manager and list blobs
+    manager = GcsManager("test-project", "test-bucket")
+
+    # Assertions
+    assert manager.list_all_blobs_with_prefix("p/", shards=4) == names
+    assert mock_client.list_blobs.call_count == 4
+    assert GcsManager._shard_ranges("p/", 1) == [(None, None)]
+
+
+@patch("google.cloud.storage.Client")
+def test_api_errors_are_logged_without_traceback(mock_client_class: Mock) -> None:
+    """Test GCS API failures skip traceback formatting while unexpected errors keep it."""
+    # Setup mock
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.list_blobs.side_effect = [google_api_exceptions.ServiceUnavailable("busy"), RuntimeError("bug")]
+
+    # Initialize manager and list blobs
+    manager = GcsManager("test-project", "test-bucket")
+    with patch("datawagon.bucket.gcs_manager.logger") as mock_logger:
+        assert manager.list_all_blobs_with_prefix("a/") == []
+        assert manager.list_all_blobs_with_prefix("b/") == []
+
+    # Assertions
+    assert [c.kwargs["exc_info"] for c in mock_logger.error.call_args_list] == [False, True]
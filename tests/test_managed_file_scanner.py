@@ -1,6 +1,8 @@
 """Tests for ManagedFileScanner."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import toml
@@ -488,3 +490,24 @@ class TestMatchedFiles:
 
         # Version should be appended to folder name
         assert results[0].files[0].storage_folder_name.endswith("_v1-1")
+
+    def test_matched_files_walks_source_dir_once(self, temp_dir: Path, mock_source_config: SourceConfig) -> None:
+        """Test that all enabled sources match against a single walk of the source tree."""
+        source_dir = temp_dir / "source"
+        (source_dir / "nested").mkdir(parents=True)
+        (source_dir / "YouTube_Brand_M_20230601.csv.gz").touch()
+        (source_dir / "nested" / "YouTube_Other_M_20230701.csv.gz").touch()
+
+        # Two enabled sources selecting the same files
+        second_source = mock_source_config.file["youtube_data"].model_copy(update={"table_name": "youtube_copy"})
+        mock_source_config.file["youtube_copy"] = second_source
+
+        scanner = object.__new__(ManagedFileScanner)
+        scanner.csv_source_dir = source_dir
+        scanner.valid_config = mock_source_config
+
+        with patch("datawagon.objects.managed_file_scanner.os.walk", wraps=os.walk) as mock_walk:
+            results = scanner.matched_files(file_extension=".csv.gz")
+
+        mock_walk.assert_called_once_with(source_dir)
+        assert [len(group.files) for group in results] == [2, 2]
@@ -0,0 +1,117 @@
+"""Tests for retry_with_backoff and TokenBucket."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from datawagon.bucket.retry_utils import TokenBucket, retry_with_backoff
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+def test_retry_succeeds_first_attempt_without_sleeping(mock_sleep: Mock) -> None:
+    """Test a successful call runs once and never sleeps."""
+    func = Mock(return_value="ok", __name__="func")
+    wrapped = retry_with_backoff(retries=3, exceptions=(ValueError,))(func)
+
+    assert wrapped("a", key="b") == "ok"
+    func.assert_called_once_with("a", key="b")
+    mock_sleep.assert_not_called()
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+def test_retry_backs_off_then_succeeds(mock_sleep: Mock) -> None:
+    """Test transient failures are retried with exponential delays."""
+    func = Mock(side_effect=[ValueError("1"), ValueError("2"), "ok"], __name__="func")
+    wrapped = retry_with_backoff(retries=3, backoff_factor=2.0, exceptions=(ValueError,), jitter=False)(func)
+
+    assert wrapped() == "ok"
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+def test_retry_jitters_delay_and_honors_retry_after(mock_sleep: Mock) -> None:
+    """Test delays are jittered and a Retry-After header overrides the backoff."""
+    throttled = ValueError("429")
+    throttled.response = Mock(headers={"Retry-After": "7"})  # type: ignore[attr-defined]
+    func = Mock(side_effect=[ValueError("1"), throttled, "ok"], __name__="func")
+    wrapped = retry_with_backoff(retries=3, exceptions=(ValueError,))(func)
+
+    with patch("datawagon.bucket.retry_utils.random.uniform", return_value=0.5):
+        assert wrapped() == "ok"
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 7.0]
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+def test_retry_caps_retry_after_at_max_delay(mock_sleep: Mock) -> None:
+    """Test an oversized Retry-After header is clamped to max_delay."""
+    throttled = ValueError("429")
+    throttled.response = Mock(headers={"Retry-After": "3600"})  # type: ignore[attr-defined]
+    func = Mock(side_effect=[throttled, "ok"], __name__="func")
+    wrapped = retry_with_backoff(retries=3, exceptions=(ValueError,), max_delay=30.0)(func)
+
+    assert wrapped() == "ok"
+    mock_sleep.assert_called_once_with(30.0)
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+def test_retry_raises_last_error_after_exhausting_retries(mock_sleep: Mock) -> None:
+    """Test the last exception propagates once retries run out."""
+    func = Mock(side_effect=[ValueError("1"), ValueError("2"), ValueError("3")], __name__="func")
+    wrapped = retry_with_backoff(retries=2, exceptions=(ValueError,))(func)
+
+    with pytest.raises(ValueError, match="3"):
+        wrapped()
+    assert func.call_count == 3
+
+
+def test_retry_does_not_catch_other_exceptions() -> None:
+    """Test exceptions outside the retry list propagate immediately."""
+    func = Mock(side_effect=KeyError("boom"), __name__="func")
+    wrapped = retry_with_backoff(retries=3, exceptions=(ValueError,))(func)
+
+    with pytest.raises(KeyError):
+        wrapped()
+    func.assert_called_once()
+
+
+@patch("datawagon.bucket.retry_utils.time.sleep")
+def test_token_bucket_blocks_once_burst_is_spent(mock_sleep: Mock) -> None:
+    """Test acquire() is free within the burst and waits once tokens run out."""
+    clock = iter([0.0, 0.0, 0.0, 0.0, 0.5])
+    with patch("datawagon.bucket.retry_utils.time.monotonic", side_effect=lambda: next(clock)):
+        limiter = TokenBucket(rate=2, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+        limiter.acquire()
+
+    mock_sleep.assert_called_once_with(0.5)
+
+
+def test_token_bucket_rejects_non_positive_rate() -> None:
+    """Test a zero or negative rate is rejected instead of dividing by zero in acquire()."""
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(rate=-1)
+
+
+def test_retry_awaits_coroutines_without_blocking() -> None:
+    """Test coroutine functions are retried with asyncio.sleep instead of time.sleep."""
+    calls = []
+
+    @retry_with_backoff(retries=2, exceptions=(ValueError,), jitter=False)
+    async def flaky() -> str:
+        calls.append(1)
+        if len(calls) < 2:
+            raise ValueError("transient")
+        return "ok"
+
+    with patch("datawagon.bucket.retry_utils.asyncio.sleep", new=AsyncMock()) as mock_async_sleep:
+        with patch("datawagon.bucket.retry_utils.time.sleep") as mock_sleep:
+            assert asyncio.run(flaky()) == "ok"
+
+    # Assertions
+    mock_async_sleep.assert_awaited_once_with(1.0)
+    mock_sleep.assert_not_called()
@@ -1,6 +1,7 @@
 """Tests for schema inference."""
 
 import gzip
+import threading
 from io import BytesIO
 from typing import Any
 from unittest.mock import Mock, patch
@@ -55,7 +56,7 @@ def test_read_csv_header_success(mock_storage_client: Any) -> None:
     mock_blob = Mock()
     mock_blob.name = "test/file.csv.gz"
 
-    def mock_download(file_obj: Any) -> None:
+    def mock_download(file_obj: Any, **kwargs: Any) -> None:
         file_obj.write(gzipped_data)
 
     mock_blob.download_to_file = mock_download
@@ -87,7 +88,7 @@ def test_read_csv_header_with_invalid_row(mock_storage_client: Any) -> None:
     mock_blob = Mock()
     mock_blob.name = "test/file.csv.gz"
 
-    def mock_download(file_obj: Any) -> None:
+    def mock_download(file_obj: Any, **kwargs: Any) -> None:
         file_obj.write(gzipped_data)
 
     mock_blob.download_to_file = mock_download
@@ -281,7 +282,7 @@ def test_try_parse_date_valid_timestamps() -> None:
 
 def test_try_parse_date_invalid() -> None:
     """Test date parsing with invalid formats."""
-    # Note: Regex validates format only, not actual calendar values
+    # Note: Only the format is validated, not actual calendar values
     # BigQuery will validate actual date values during load
     invalid_dates = [
         "",
@@ -292,6 +293,10 @@ def test_try_parse_date_invalid() -> None:
         "null",
         "123",
         "2023",
+        "2023-06/30",  # Mixed separators
+        "2023-06-30T12:00:00",  # ISO "T" separator
+        "2023-06-30 12:00:00.",  # Fraction without digits
+        "2023-06-30 12:00",  # Missing seconds
     ]
     for value in invalid_dates:
         result = SchemaInferenceManager._try_parse_date(value)
@@ -308,7 +313,7 @@ def test_infer_column_type_all_int() -> None:
     sample_rows = [[str(i), "other"] for i in range(1, 101)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "INT64"
 
 
@@ -317,7 +322,7 @@ def test_infer_column_type_all_bignumeric() -> None:
     sample_rows = [[f"{i}.5", "other"] for i in range(1, 101)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "BIGNUMERIC"
 
 
@@ -326,7 +331,7 @@ def test_infer_column_type_all_bool() -> None:
     sample_rows = [["true", "other"] if i % 2 == 0 else ["false", "other"] for i in range(100)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "BOOL"
 
 
@@ -335,7 +340,7 @@ def test_infer_column_type_all_date() -> None:
     sample_rows = [["2023-06-30", "other"] for _ in range(100)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "DATE"
 
 
@@ -344,7 +349,7 @@ def test_infer_column_type_all_timestamp() -> None:
     sample_rows = [["2023-06-30 12:00:00", "other"] for _ in range(100)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "TIMESTAMP"
 
 
@@ -354,7 +359,7 @@ def test_infer_column_type_mixed_below_threshold() -> None:
     sample_rows = [[str(i), "other"] for i in range(1, 91)] + [["abc", "other"] for _ in range(10)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "STRING"
 
 
@@ -364,7 +369,7 @@ def test_infer_column_type_mostly_null() -> None:
     sample_rows = [["123", "other"] for _ in range(5)] + [["", "other"] for _ in range(95)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "STRING"
 
 
@@ -378,7 +383,7 @@ def test_infer_column_type_skips_empty_values() -> None:
     )
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     assert result == "INT64"
 
 
@@ -389,7 +394,7 @@ def test_infer_column_type_ragged_rows() -> None:
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
     # Should handle missing column gracefully
-    result = manager.infer_column_type("test_col", 1, sample_rows)
+    result = manager.infer_column_type("test_col", [row[1] if len(row) > 1 else "" for row in sample_rows])
     # Only 50 values available, should detect INT64
     assert result == "INT64"
 
@@ -413,7 +418,7 @@ def test_read_csv_header_and_sample_returns_sample_rows(mock_storage_client: Any
     mock_blob = Mock()
     mock_blob.name = "test/file.csv.gz"
 
-    def mock_download(file_obj: Any) -> None:
+    def mock_download(file_obj: Any, **kwargs: Any) -> None:
         file_obj.write(gzipped_data)
 
     mock_blob.download_to_file = mock_download
@@ -479,7 +484,7 @@ def test_infer_column_type_mixed_int_and_decimal() -> None:
     sample_rows = [[str(i), "other"] for i in range(1, 51)] + [[f"{i}.5", "other"] for i in range(51, 101)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("test_col", 0, sample_rows)
+    result = manager.infer_column_type("test_col", [row[0] for row in sample_rows])
     # Without revenue handling: INT64 (50%) + BIGNUMERIC (50%) → STRING
     assert result == "STRING"
 
@@ -490,7 +495,7 @@ def test_infer_column_type_revenue_mixed_int_and_decimal() -> None:
     sample_rows = [[str(i), "other"] for i in range(1, 51)] + [[f"{i}.5", "other"] for i in range(51, 101)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("partner_revenue", 0, sample_rows)
+    result = manager.infer_column_type("partner_revenue", [row[0] for row in sample_rows])
     # Revenue column: INT64 (50) + BIGNUMERIC (50) = 100/100 = 100% → BIGNUMERIC
     assert result == "BIGNUMERIC"
 
@@ -500,7 +505,7 @@ def test_infer_column_type_revenue_all_integers() -> None:
     sample_rows = [[str(i), "other"] for i in range(1, 101)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("total_revenue", 0, sample_rows)
+    result = manager.infer_column_type("total_revenue", [row[0] for row in sample_rows])
     # Revenue column: INT64 (100) + BIGNUMERIC (0) = 100/100 = 100% → BIGNUMERIC
     assert result == "BIGNUMERIC"
 
@@ -510,6 +515,154 @@ def test_infer_column_type_non_revenue_integers_stay_int64() -> None:
     sample_rows = [[str(i), "other"] for i in range(1, 101)]
     manager = SchemaInferenceManager(Mock(), "test-bucket")
 
-    result = manager.infer_column_type("view_count", 0, sample_rows)
+    result = manager.infer_column_type("view_count", [row[0] for row in sample_rows])
     # Non-revenue column with all integers → INT64
     assert result == "INT64"
+
+
+@patch("datawagon.bucket.schema_inference.storage.Client")
+def test_read_csv_header_and_sample_downloads_head_only(mock_storage_client: Any) -> None:
+    """Test sampling fetches a byte range and widens it only when the sample doesn't fit."""
+    # Create mock CSV data that compresses poorly, so the sample spans several small ranges
+    rows = [",".join(f"{(i * 7919 + j * 104729) % 1000003:x}" for j in range(3)) for i in range(400)]
+    gzipped = BytesIO()
+    with gzip.open(gzipped, mode="wt", encoding="utf-8") as f:
+        f.write("Col1,Col2,Col3\n" + "\n".join(rows) + "\n")
+    gzipped_data = gzipped.getvalue()
+
+    # Mock GCS blob honoring ranged downloads
+    mock_blob = Mock()
+    mock_blob.name = "test/file.csv.gz"
+    requested_ends = []
+
+    def mock_download(file_obj: Any, start: int = 0, end: Any = None) -> None:
+        requested_ends.append(end)
+        file_obj.write(gzipped_data[start : None if end is None else end + 1])
+
+    mock_blob.download_to_file = mock_download
+    mock_bucket = Mock()
+    mock_bucket.list_blobs.return_value = [mock_blob]
+    mock_client = Mock()
+    mock_client.bucket.return_value = mock_bucket
+
+    # Test
+    manager = SchemaInferenceManager(mock_client, "test-bucket")
+    with patch("datawagon.bucket.schema_inference._SAMPLE_RANGE_BYTES", (64, len(gzipped_data) - 1)):
+        result = manager.read_csv_header_and_sample("test-folder", sample_size=100)
+
+    # Assertions
+    assert result is not None
+    header, sample_rows, _has_title_row = result
+    assert header == ["Col1", "Col2", "Col3"]
+    assert sample_rows == [row.split(",") for row in rows[:100]]
+    assert requested_ends == [63, len(gzipped_data) - 2]
+
+
+def test_infer_schemas_runs_folders_concurrently() -> None:
+    """Test infer_schemas infers each distinct folder once, overlapping the calls."""
+    manager = SchemaInferenceManager(Mock(), "test-bucket")
+    barrier = threading.Barrier(2, timeout=5)
+    schema = [bigquery.SchemaField("id", "INT64", mode="NULLABLE")]
+
+    def infer_schema(folder: str) -> Any:
+        barrier.wait()  # both folders must be in flight together
+        return (schema, False) if folder == "a" else None
+
+    with patch.object(manager, "infer_schema", side_effect=infer_schema) as mock_infer:
+        results = manager.infer_schemas(["a", "b", "a"])
+
+    # Assertions
+    assert results == {"a": (schema, False), "b": None}
+    assert mock_infer.call_count == 2
+    assert manager.infer_schemas([]) == {}
+
+
+@patch("datawagon.bucket.schema_inference.storage.Client")
+def test_read_csv_header_and_sample_reads_newest_file(mock_storage_client: Any) -> None:
+    """Test the newest partition is sampled from a names-only, extension-filtered listing."""
+    gzipped = BytesIO()
+    with gzip.open(gzipped, mode="wt", encoding="utf-8") as f:
+        f.write("Col1,Col2\nval1,val2\n")
+
+    # Mock GCS blobs in listing order
+    blobs = []
+    for name in ["f/report_date=2023-06-30/a.csv.gz", "f/report_date=2023-08-31/c.csv.gz", "f/readme.txt"]:
+        blob = Mock()
+        blob.name = name
+        blob.download_to_file = Mock(side_effect=lambda file_obj, **kwargs: file_obj.write(gzipped.getvalue()))
+        blobs.append(blob)
+
+    mock_bucket = Mock()
+    mock_bucket.list_blobs.return_value = iter(blobs)
+    mock_client = Mock()
+    mock_client.bucket.return_value = mock_bucket
+
+    # Test
+    manager = SchemaInferenceManager(mock_client, "test-bucket")
+    result = manager.read_csv_header_and_sample("f/", sample_size=1)
+
+    # Assertions
+    assert result == (["Col1", "Col2"], [["val1", "val2"]], False)
+    blobs[1].download_to_file.assert_called_once()
+    mock_bucket.list_blobs.assert_called_once_with(
+        prefix="f/", match_glob="**.csv.gz", fields="items(name),nextPageToken", page_size=1000
+    )
+
+
+@patch("datawagon.bucket.schema_inference.storage.Client")
+def test_read_csv_header_and_sample_stops_at_byte_budget(mock_storage_client: Any) -> None:
+    """Test wide rows stop sampling once the byte budget is spent, before sample_size rows."""
+    wide_value = "\u00e9" * 200  # 2 bytes per character in UTF-8
+    gzipped = BytesIO()
+    with gzip.open(gzipped, mode="wt", encoding="utf-8") as f:
+        f.write("Col1,Col2\n" + "".join(f"{wide_value},{i}\n" for i in range(10)))
+
+    # Mock GCS blob
+    mock_blob = Mock()
+    mock_blob.name = "f/file.csv.gz"
+    mock_blob.download_to_file = Mock(side_effect=lambda file_obj, **kwargs: file_obj.write(gzipped.getvalue()))
+
+    mock_bucket = Mock()
+    mock_bucket.list_blobs.return_value = [mock_blob]
+    mock_client = Mock()
+    mock_client.bucket.return_value = mock_bucket
+
+    # Test
+    manager = SchemaInferenceManager(mock_client, "test-bucket")
+    result = manager.read_csv_header_and_sample("f/", sample_size=10, sample_bytes=1000)
+
+    # Assertions: 403 bytes per row (not 201 characters), so the third row crosses the 1000-byte budget
+    assert result is not None
+    _header, sample_rows, _has_title_row = result
+    assert sample_rows == [[wide_value, "0"], [wide_value, "1"], [wide_value, "2"]]
+
+
+def test_classify_value_matches_detection_order() -> None:
+    """Test _classify_value applies the INT64, BOOL, BIGNUMERIC, TIMESTAMP, DATE order."""
+    expected = {
+        "1": "INT64",
+        "00123": "BIGNUMERIC",
+        "yes": "BOOL",
+        "1.5": "BIGNUMERIC",
+        "2023-06-30 12:00:00": "TIMESTAMP",
+        "2023-06-30": "DATE",
+        "abc": None,
+    }
+    for value, value_type in expected.items():
+        assert SchemaInferenceManager._classify_value(value) == value_type, value
+
+
+def test_infer_schema_transposes_ragged_rows() -> None:
+    """Test short rows count as nulls for the columns they lack, including columns no row has."""
+    manager = SchemaInferenceManager(Mock(), "test-bucket")
+    header = ["id", "views", "notes"]
+    sample_rows = [["1", "10"] for _ in range(50)] + [["2"] for _ in range(50)]
+
+    with patch.object(manager, "read_csv_header_and_sample") as mock_read:
+        mock_read.return_value = (header, sample_rows, False)
+        result = manager.infer_schema("test-folder")
+
+    # Assertions
+    assert result is not None
+    schema, _has_title_row = result
+    assert [field.field_type for field in schema] == ["INT64", "INT64", "STRING"]